@@ -0,0 +1,87 @@
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from main import BirthdayRoleScheduler, GuildBirthdays, birthday_transition
+
+GUILD_ID = 1
+
+
+def synthetic_guild(rng: random.Random, members: int, with_birthdays: int) -> tuple[list[int], GuildBirthdays]:
+    member_ids = rng.sample(range(10**17, 10**18), members)
+    birthdays = {uid: f"{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" for uid in rng.sample(member_ids, with_birthdays)}
+    return member_ids, GuildBirthdays(birthdays)
+
+
+def member_scan(member_ids: list[int], entry: GuildBirthdays, holders: set[int], today: str) -> int:
+    changes = 0
+    for uid in member_ids:
+        active = entry.birthdays.get(uid) == today
+        if active != (uid in holders):
+            changes += 1
+    return changes
+
+
+def date_index_pass(entry: GuildBirthdays, holders: set[int], today: str) -> int:
+    changes = 0
+    for uid in entry.on(today) | holders:
+        active = entry.birthdays.get(uid) == today
+        if active != (uid in holders):
+            changes += 1
+    return changes
+
+
+def deadline_pass(scheduler: BirthdayRoleScheduler, entry: GuildBirthdays, now: datetime) -> int:
+    changes = 0
+    while (due := scheduler.pop_due(now.timestamp())) is not None:
+        _, next_at = birthday_transition(entry.birthdays[due[1]], None, now)
+        scheduler.schedule(due[0], due[1], next_at)
+        changes += 1
+    return changes
+
+
+def measure(members: int, with_birthdays: int) -> str:
+    rng = random.Random(members)
+    member_ids, entry = synthetic_guild(rng, members, with_birthdays)
+    day = datetime(2026, 3, 14, tzinfo=timezone.utc)
+    today = day.strftime("%m-%d")
+    holders = {uid for uid, mm_dd in entry.birthdays.items() if mm_dd == (day - timedelta(days=1)).strftime("%m-%d")}
+
+    started = time.perf_counter()
+    scan_changes = member_scan(member_ids, entry, holders, today)
+    scan_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    index_changes = date_index_pass(entry, holders, today)
+    index_ms = (time.perf_counter() - started) * 1000
+
+    scheduler = BirthdayRoleScheduler()
+    started = time.perf_counter()
+    for uid, mm_dd in entry.birthdays.items():
+        active, next_at = birthday_transition(mm_dd, None, day - timedelta(seconds=1))
+        scheduler.schedule(GUILD_ID, uid, next_at)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    heap_changes = deadline_pass(scheduler, entry, day)
+    heap_ms = (time.perf_counter() - started) * 1000
+
+    return (
+        f"members={members:>7} birthdays={with_birthdays:>6}  scan={scan_ms:8.3f} ms ({scan_changes} changes)  "
+        f"date_index={index_ms:7.3f} ms ({index_changes} changes)  speedup={scan_ms / index_ms if index_ms else float('inf'):7.1f}x  "
+        f"deadline={heap_ms:7.3f} ms ({heap_changes} changes)  startup_schedule={build_ms:8.3f} ms"
+    )
+
+
+def main() -> None:
+    lines = [measure(members, with_birthdays) for members, with_birthdays in ((1_000, 200), (50_000, 5_000), (200_000, 20_000))]
+    report = "\n".join(lines)
+    print(report)
+    if "--write" in sys.argv:
+        with open("bench_output.txt", "a", encoding="utf-8") as fh:
+            fh.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
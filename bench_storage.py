@@ -0,0 +1,54 @@
+import json
+import random
+import sys
+import timeit
+
+from main import decode_storage_payload, encode_storage_payload
+
+
+def snowflake(rng: random.Random) -> str:
+    return str(rng.randrange(100_000_000_000_000_000, 1_400_000_000_000_000_000))
+
+
+def birthday_document(rng: random.Random, members: int) -> dict:
+    birthdays = {snowflake(rng): f"{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" for _ in range(members)}
+    guild = {"birthdays": birthdays, "public_message": {"channel_id": int(snowflake(rng)), "message_id": int(snowflake(rng))}}
+    return {"schema": 3, "guilds": {snowflake(rng): guild}}
+
+
+def pool_document(rng: random.Random, entries: int) -> dict:
+    picks = [{"user_id": int(snowflake(rng)), "title": f"Movie Title Number {i}"} for i in range(entries)]
+    return {"schema": 3, "guilds": {snowflake(rng): {"entries": picks, "message": None}}}
+
+
+def measure(label: str, data: dict, repeat: int) -> str:
+    legacy = json.dumps(data, indent=2)
+    compact = encode_storage_payload(data)
+    assert decode_storage_payload(compact) == data
+    assert decode_storage_payload(legacy) == data
+    encode_ms = min(timeit.repeat(lambda: encode_storage_payload(data), number=repeat, repeat=3)) / repeat * 1000
+    decode_ms = min(timeit.repeat(lambda: decode_storage_payload(compact), number=repeat, repeat=3)) / repeat * 1000
+    json_ms = min(timeit.repeat(lambda: json.loads(legacy), number=repeat, repeat=3)) / repeat * 1000
+    return (
+        f"{label:<16} json={len(legacy):>8} chars  compact={len(compact):>8} chars  "
+        f"ratio={len(legacy) / len(compact):4.2f}x  encode={encode_ms:7.3f} ms  "
+        f"decode={decode_ms:7.3f} ms  json_decode={json_ms:7.3f} ms"
+    )
+
+
+def main() -> None:
+    rng = random.Random(1234)
+    lines = []
+    for members in (60, 500, 5000):
+        lines.append(measure(f"birthdays x{members}", birthday_document(rng, members), 50 if members < 5000 else 5))
+    for entries in (30, 300):
+        lines.append(measure(f"pool x{entries}", pool_document(rng, entries), 50))
+    report = "\n".join(lines)
+    print(report)
+    if "--write" in sys.argv:
+        with open("bench_output.txt", "a", encoding="utf-8") as fh:
+            fh.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
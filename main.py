@@ -42,12 +42,13 @@
 # TRUSTED
 # • Permissions: Member + announcements + VC status
 # • Commands:
-#   /birthdays /birthdays_public /media_reload /library_sync
+#   /birthdays /birthdays_public /birthdays_import /birthdays_export
+#   /media_reload /library_sync /tasks /jobs
 #   /pool_public /pool_remove /qotd_send /random /set_for /remove_for
 # MEMBER
 # • Permissions: Standard chat + VC + app commands
 # • Commands:
-#   /birthdays /set /color /pick /pool /replace /search
+#   /birthdays /birthdays_upcoming /set /color /pick /pool /replace /search
 # ============================================================
 
 
@@ -61,14 +62,36 @@ import random as pyrandom
 import gspread
 import traceback
 import sys
-from datetime import datetime, time, timezone
+import copy
+import sqlite3
+import zlib
+import base64
+import heapq
+import bisect
+import csv
+import io
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
 from google.oauth2.service_account import Credentials
 
 
 ############### CONSTANTS & CONFIG ###############
 intents = discord.Intents.default()
 intents.members = True
-bot = discord.Bot(intents=intents)
+
+class MemberBot(discord.Bot):
+    async def close(self):
+        try:
+            await flush_pending_writes()
+        except Exception as e:
+            print("flush_pending_writes error:", repr(e))
+        await super().close()
+
+bot = MemberBot(intents=intents)
 
 def _env_int(var_name: str, default: int) -> int:
     value = os.getenv(var_name)
@@ -99,7 +122,40 @@ ENABLE_TV_IN_PICK = False
 RATING_CHANNEL_ID = _env_int("RATING_CHANNEL_ID", 0)  # ・Ratings
 MOVIE_STORAGE_CHANNEL_ID = _env_int("MOVIE_STORAGE_CHANNEL_ID", 0)  # For trailer messages linked to sheets
 MAX_POOL_ENTRIES_PER_USER = _env_int("MAX_POOL_ENTRIES_PER_USER", 3) 
+POOL_SAVE_DEBOUNCE_SECONDS = _env_int("POOL_SAVE_DEBOUNCE_SECONDS", 2)
+BIRTHDAY_TXN_WINDOW_MS = _env_int("BIRTHDAY_TXN_WINDOW_MS", 200)
+DEBOUNCE_RETRY_MAX_SECONDS = _env_int("DEBOUNCE_RETRY_MAX_SECONDS", 300)
+STORAGE_SHARD_CHARS = 1900
+STORAGE_FORMAT_MARKER = "C1:"
+STORAGE_COMPACT_ENCODING = _env_int("STORAGE_COMPACT_ENCODING", 1) != 0
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "sqlite").strip().lower()
+STORAGE_DB_PATH = os.getenv("STORAGE_DB_PATH", "member_bot.db")
+STORAGE_STATE_PATH = os.getenv("STORAGE_STATE_PATH", "member_bot_state.json")
+STORAGE_SCAN_LIMIT = _env_int("STORAGE_SCAN_LIMIT", 200)
+STORAGE_MIRROR_ENABLED = _env_int("STORAGE_MIRROR_ENABLED", 1) != 0
+STORAGE_MIRROR_DEBOUNCE_SECONDS = _env_int("STORAGE_MIRROR_DEBOUNCE_SECONDS", 5)
+JOURNAL_COMPACT_RECORDS = _env_int("JOURNAL_COMPACT_RECORDS", 100)
+STORAGE_SCHEMA_VERSION = 3
+DAILY_JOB_RETRY_SECONDS = _env_int("DAILY_JOB_RETRY_SECONDS", 900)
+BIRTHDAY_ROLE_RETRY_SECONDS = max(1, _env_int("BIRTHDAY_ROLE_RETRY_SECONDS", 300))
+TASK_RESTART_DELAY_SECONDS = _env_int("TASK_RESTART_DELAY_SECONDS", 5)
+GUILD_FANOUT_CONCURRENCY = max(1, _env_int("GUILD_FANOUT_CONCURRENCY", 4))
+MEMBER_OP_CONCURRENCY = max(1, _env_int("MEMBER_OP_CONCURRENCY", 5))
+JOB_METRICS_HISTORY = max(1, _env_int("JOB_METRICS_HISTORY", 50))
+SHEETS_MAX_WORKERS = max(1, _env_int("SHEETS_MAX_WORKERS", 2))
+SHEETS_TIMEOUT_SECONDS = _env_int("SHEETS_TIMEOUT_SECONDS", 30)
+SHEETS_RETRIES = max(0, _env_int("SHEETS_RETRIES", 3))
+SHEETS_RETRY_BASE_SECONDS = _env_int("SHEETS_RETRY_BASE_SECONDS", 1)
+QOTD_BANK_REFRESH_SECONDS = _env_int("QOTD_BANK_REFRESH_SECONDS", 21600)
+QOTD_TABS = ("Regular", "Fall Season", "Christmas")
+QOTD_POST_HOUR = _env_int("QOTD_POST_HOUR", 17) % 24
+QOTD_STAGE_LEAD_HOURS = _env_int("QOTD_STAGE_LEAD_HOURS", 6)
+QOTD_STAGE_QUEUE_SIZE = max(1, _env_int("QOTD_STAGE_QUEUE_SIZE", 3))
 PAGE_SIZE = 25
+EMBED_DESCRIPTION_LIMIT = 4096
+MESSAGE_EMBEDS_CHAR_LIMIT = 6000
+MESSAGE_EMBEDS_LIMIT = 10
+BIRTHDAY_IMPORT_MAX_BYTES = _env_int("BIRTHDAY_IMPORT_MAX_BYTES", 1_000_000)
 
 QOTD_CHANNEL_ID = _env_int("QOTD_CHANNEL_ID", 0)
 
@@ -115,6 +171,8 @@ DEAD_CHAT_COLORS = [discord.Color.red(), discord.Color.orange(), discord.Color.g
 
 BIRTHDAY_ROLE_ID = _env_int("BIRTHDAY_ROLE_ID", 0)  # The role given when it is their birthday
 BIRTHDAY_STORAGE_CHANNEL_ID = _env_int("BIRTHDAY_STORAGE_CHANNEL_ID", 0)
+BIRTHDAY_DEFAULT_TIMEZONE = os.getenv("BIRTHDAY_DEFAULT_TIMEZONE", "UTC")
+BIRTHDAY_TIMEZONES = sorted(available_timezones())
 MONTH_CHOICES = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
 MONTH_TO_NUM = {name: f"{i:02d}" for i, name in enumerate(MONTH_CHOICES, start=1)}
 
@@ -122,13 +180,1364 @@ BOT_LOG_THREAD_ID = _env_int("BOT_LOG_THREAD_ID", 0)
 
 
 ############### GLOBAL STATE / STORAGE ###############
-storage_message_id: int | None = None
-pool_storage_message_id: int | None = None
+@dataclass
+class GuildBirthdays:
+    birthdays: dict[int, str] = field(default_factory=dict)
+    public_message: tuple[int, int] | None = None
+    timezones: dict[int, str] = field(default_factory=dict)
+    by_date: dict[str, set[int]] = field(default_factory=dict, repr=False, compare=False)
+    calendar: list[tuple[str, int]] = field(default_factory=list, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.by_date = {}
+        for user_id, mm_dd in self.birthdays.items():
+            self.by_date.setdefault(mm_dd, set()).add(user_id)
+        self.calendar = sorted((mm_dd, user_id) for user_id, mm_dd in self.birthdays.items())
+
+    def add(self, user_id: int, mm_dd: str, tz: str | None = None):
+        self.remove(user_id)
+        self.birthdays[user_id] = mm_dd
+        if tz:
+            self.timezones[user_id] = tz
+        self.by_date.setdefault(mm_dd, set()).add(user_id)
+        bisect.insort(self.calendar, (mm_dd, user_id))
+
+    def remove(self, user_id: int) -> bool:
+        mm_dd = self.birthdays.pop(user_id, None)
+        if mm_dd is None:
+            return False
+        self.timezones.pop(user_id, None)
+        members = self.by_date.get(mm_dd)
+        if members is not None:
+            members.discard(user_id)
+            if not members:
+                del self.by_date[mm_dd]
+        index = bisect.bisect_left(self.calendar, (mm_dd, user_id))
+        if index < len(self.calendar) and self.calendar[index] == (mm_dd, user_id):
+            del self.calendar[index]
+        return True
+
+    def on(self, mm_dd: str) -> set[int]:
+        return self.by_date.get(mm_dd, set())
+
+    def between(self, start: str, end: str) -> list[tuple[str, int]]:
+        lo = bisect.bisect_left(self.calendar, (start,))
+        hi = bisect.bisect_left(self.calendar, (end,))
+        if start < end:
+            return self.calendar[lo:hi]
+        return self.calendar[lo:] + self.calendar[:hi]
+
+@dataclass
+class GuildPool:
+    entries: list[tuple[int, str]] = field(default_factory=list)
+    message: tuple[int, int] | None = None
+
+@dataclass
+class JobOutcome:
+    items: int = 0
+    errors: int = 0
+
+    def __add__(self, other: "JobOutcome") -> "JobOutcome":
+        return JobOutcome(self.items + other.items, self.errors + other.errors)
+
+@dataclass
+class JobRun:
+    job: str
+    scheduled: datetime
+    started: datetime
+    duration: float
+    items: int
+    errors: int
+    status: str
+
+    @property
+    def lag(self) -> float:
+        return max(0.0, (self.started - self.scheduled).total_seconds())
+
+class JobMetrics:
+    def __init__(self, history: int):
+        self.history = history
+        self.runs: dict[str, deque[JobRun]] = {}
+
+    def record(self, run: JobRun):
+        self.runs.setdefault(run.job, deque(maxlen=self.history)).append(run)
+
+    def recent(self, job: str | None = None, limit: int = 10) -> list[JobRun]:
+        runs = [run for name, history in self.runs.items() if job in (None, name) for run in history]
+        return sorted(runs, key=lambda run: run.started, reverse=True)[:limit]
+
+    def percentile(self, job: str, pct: float) -> float | None:
+        return percentile([run.duration for run in self.runs.get(job, ())], pct)
+
+    def describe(self, job: str) -> str:
+        history = self.runs.get(job)
+        if not history:
+            return f"{job}: no runs yet"
+        failed = sum(1 for run in history if run.status != "ok")
+        lags = sorted(run.lag for run in history)
+        return (
+            f"{job}: {len(history)} run(s), {failed} failed • p50 {self.percentile(job, 50):.2f}s "
+            f"p95 {self.percentile(job, 95):.2f}s • max lag {lags[-1]:.1f}s"
+        )
+
+class DailySchedule:
+    def __init__(self, hour: int, minute: int, zone: tzinfo = timezone.utc):
+        self.hour = hour
+        self.minute = minute
+        self.zone = zone
+
+    def latest(self, now: datetime) -> datetime:
+        local = now.astimezone(self.zone)
+        slot = datetime.combine(local.date(), time(self.hour, self.minute), tzinfo=self.zone)
+        if slot > local:
+            slot = datetime.combine(local.date() - timedelta(days=1), time(self.hour, self.minute), tzinfo=self.zone)
+        return slot.astimezone(timezone.utc)
+
+    def next(self, now: datetime) -> datetime:
+        local = now.astimezone(self.zone)
+        slot = datetime.combine(local.date(), time(self.hour, self.minute), tzinfo=self.zone)
+        if slot <= local:
+            slot = datetime.combine(local.date() + timedelta(days=1), time(self.hour, self.minute), tzinfo=self.zone)
+        return slot.astimezone(timezone.utc)
+
+    def describe(self) -> str:
+        return f"daily {self.hour:02d}:{self.minute:02d} {self.zone}"
+
+class ScheduledJob:
+    def __init__(self, name: str, next_run, run, timeout: float, spec: str):
+        self.name = name
+        self.next_run = next_run
+        self.run = run
+        self.timeout = timeout
+        self.spec = spec
+        self.task: asyncio.Task | None = None
+        self.next_at: datetime | None = None
+        self.runs = 0
+        self.timeouts = 0
+        self.failures = 0
+
+class JobScheduler:
+    def __init__(self):
+        self.jobs: dict[str, ScheduledJob] = {}
+        self.heap: list[tuple[float, int, str]] = []
+        self.tokens: dict[str, int] = {}
+        self.wake = asyncio.Event()
+        self.wakeups = 0
+
+    def register(self, name: str, next_run, run, timeout: float, spec: str):
+        self.jobs[name] = ScheduledJob(name, next_run, run, timeout, spec)
+
+    def register_daily(self, name: str, schedule: DailySchedule, run, timeout: float):
+        def next_run(now: datetime) -> datetime:
+            retry_at = job_ledger.next_retry(name)
+            upcoming = schedule.next(now)
+            return min(upcoming, retry_at) if retry_at else upcoming
+        self.register(name, next_run, lambda scheduled: run(schedule.latest(datetime.now(timezone.utc))), timeout, schedule.describe())
+
+    def poke(self, name: str, when: datetime | None = None):
+        job = self.jobs.get(name)
+        if job is None or job.task is not None:
+            return
+        token = self.tokens.get(name, 0) + 1
+        self.tokens[name] = token
+        job.next_at = when or job.next_run(datetime.now(timezone.utc))
+        if job.next_at is None:
+            return
+        entry = (job.next_at.timestamp(), token, name)
+        heapq.heappush(self.heap, entry)
+        if self.heap[0] == entry:
+            self.wake.set()
+
+    async def run(self):
+        await bot.wait_until_ready()
+        started = datetime.now(timezone.utc)
+        for name in self.jobs:
+            self.poke(name, started)
+        while not bot.is_closed():
+            while self.heap and self.tokens.get(self.heap[0][2]) != self.heap[0][1]:
+                heapq.heappop(self.heap)
+            now = datetime.now(timezone.utc).timestamp()
+            if self.heap and self.heap[0][0] <= now:
+                deadline, _, name = heapq.heappop(self.heap)
+                self._start(self.jobs[name], datetime.fromtimestamp(deadline, timezone.utc))
+                continue
+            self.wake.clear()
+            try:
+                await asyncio.wait_for(self.wake.wait(), self.heap[0][0] - now if self.heap else None)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeups += 1
+
+    def _start(self, job: ScheduledJob, scheduled: datetime):
+        if job.task is not None:
+            return
+        job.next_at = None
+        job.task = asyncio.create_task(self._execute(job, scheduled))
+
+    async def _execute(self, job: ScheduledJob, scheduled: datetime):
+        started = datetime.now(timezone.utc)
+        outcome = JobOutcome()
+        status = "ok"
+        run = asyncio.ensure_future(job.run(scheduled))
+        try:
+            done, _ = await asyncio.wait({run}, timeout=job.timeout)
+            if not done:
+                status = "timeout"
+                job.timeouts += 1
+                run.cancel()
+                await asyncio.gather(run, return_exceptions=True)
+                await log_to_thread(f"scheduler: {job.name} timed out after {job.timeout}s (scheduled {scheduled:%Y-%m-%d %H:%M:%S} UTC).")
+            else:
+                outcome = run.result() or outcome
+        except Exception as e:
+            status = "error"
+            job.failures += 1
+            await log_exception(f"scheduler_{job.name}", e)
+        except asyncio.CancelledError:
+            status = "cancelled"
+            run.cancel()
+            raise
+        finally:
+            duration = (datetime.now(timezone.utc) - started).total_seconds()
+            job_metrics.record(JobRun(job.name, scheduled, started, duration, outcome.items, outcome.errors + (status != "ok"), status))
+            job.runs += 1
+            job.task = None
+            self.poke(job.name)
+
+    def summary(self) -> str:
+        parts = []
+        for job in self.jobs.values():
+            upcoming = f"{job.next_at:%Y-%m-%d %H:%M:%S}" if job.next_at else ("running" if job.task else "idle")
+            parts.append(f"{job.name}[{job.spec}] next={upcoming} runs={job.runs} timeouts={job.timeouts} failures={job.failures}")
+        return f"scheduler: wakeups={self.wakeups} " + " ".join(parts)
+
+class TaskRegistry:
+    def __init__(self):
+        self.factories: dict[str, object] = {}
+        self.tasks: dict[str, asyncio.Task] = {}
+        self.started_at: dict[str, datetime] = {}
+        self.restarts: dict[str, int] = {}
+        self.last_error: dict[str, str] = {}
+
+    def ensure(self, name: str, factory) -> bool:
+        self.factories[name] = factory
+        task = self.tasks.get(name)
+        if task is not None and not task.done():
+            return False
+        self._start(name)
+        return True
+
+    def _start(self, name: str):
+        task = bot.loop.create_task(self.factories[name](), name=name)
+        task.add_done_callback(lambda t: self._on_done(name, t))
+        self.tasks[name] = task
+        self.started_at[name] = datetime.now(timezone.utc)
+
+    def _on_done(self, name: str, task: asyncio.Task):
+        if task.cancelled() or bot.is_closed() or self.tasks.get(name) is not task:
+            return
+        error = task.exception()
+        self.last_error[name] = repr(error) if error else "exited without error"
+        self.restarts[name] = self.restarts.get(name, 0) + 1
+        bot.loop.create_task(log_to_thread(f"TaskRegistry: {name} stopped ({self.last_error[name]}); restarting in {TASK_RESTART_DELAY_SECONDS}s."))
+        bot.loop.call_later(TASK_RESTART_DELAY_SECONDS, self._restart, name, task)
+
+    def _restart(self, name: str, previous: asyncio.Task):
+        if self.tasks.get(name) is previous and not bot.is_closed():
+            self._start(name)
+
+    def describe(self) -> list[str]:
+        lines = []
+        now = datetime.now(timezone.utc)
+        for name, task in self.tasks.items():
+            state = "running" if not task.done() else "restarting"
+            uptime = int((now - self.started_at[name]).total_seconds())
+            line = f"{name}: {state} • up {uptime}s • restarts {self.restarts.get(name, 0)}"
+            if name in self.last_error:
+                line += f" • last stop: {self.last_error[name]}"
+            lines.append(line)
+        return lines
+
+class SheetsClient:
+    def __init__(self, client, sheet_id: str | None):
+        self.client = client
+        self.sheet_id = sheet_id
+        self.executor = ThreadPoolExecutor(max_workers=SHEETS_MAX_WORKERS, thread_name_prefix="sheets")
+        self.handle = None
+        self.worksheets: dict[str, object] = {}
+        self.latencies: dict[str, deque[float]] = {}
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None and bool(self.sheet_id)
+
+    async def call(self, op: str, fn, *args):
+        loop = asyncio.get_running_loop()
+        for attempt in range(SHEETS_RETRIES + 1):
+            started = loop.time()
+            self.calls += 1
+            try:
+                result = await asyncio.wait_for(loop.run_in_executor(self.executor, lambda: fn(*args)), SHEETS_TIMEOUT_SECONDS)
+            except Exception as e:
+                if attempt == SHEETS_RETRIES or not self._retryable(e):
+                    self.failures += 1
+                    raise
+                self.retries += 1
+                delay = SHEETS_RETRY_BASE_SECONDS * 2 ** attempt + pyrandom.uniform(0, 1)
+                await log_to_thread(f"sheets: {op} failed ({e!r}); retry {attempt + 1}/{SHEETS_RETRIES} in {delay:.1f}s.")
+                await asyncio.sleep(delay)
+                continue
+            self.latencies.setdefault(op, deque(maxlen=100)).append(loop.time() - started)
+            return result
+
+    @staticmethod
+    def _retryable(error: Exception) -> bool:
+        if isinstance(error, gspread.exceptions.APIError):
+            return error.response.status_code in (429, 500, 502, 503, 504)
+        return isinstance(error, (asyncio.TimeoutError, OSError))
+
+    async def spreadsheet(self):
+        if not self.enabled:
+            raise RuntimeError("Google Sheets is not configured.")
+        if self.handle is None:
+            self.handle = await self.call("open", self.client.open_by_key, self.sheet_id)
+        return self.handle
+
+    def forget(self):
+        self.handle = None
+        self.worksheets = {}
+
+    async def worksheet(self, title: str):
+        if title not in self.worksheets:
+            sh = await self.spreadsheet()
+            self.worksheets[title] = await self.call("worksheet", sh.worksheet, title)
+        return self.worksheets[title]
+
+    async def first_worksheet(self):
+        sh = await self.spreadsheet()
+        return await self.call("worksheet", sh.get_worksheet, 0)
+
+    async def values(self, ws) -> list[list[str]]:
+        return await self.call("get_all_values", ws.get_all_values)
+
+    async def snapshot(self, titles: list[str]) -> dict[str, list[list[str]]]:
+        if not self.enabled:
+            raise RuntimeError("Google Sheets is not configured.")
+        try:
+            response = await self._batch_get(titles)
+        except gspread.exceptions.APIError as e:
+            if e.response.status_code != 400:
+                raise
+            sh = await self.spreadsheet()
+            self.worksheets.update({ws.title: ws for ws in await self.call("worksheets", sh.worksheets)})
+            titles = [title for title in titles if title in self.worksheets]
+            if not titles:
+                return {}
+            response = await self._batch_get(titles)
+        snapshot = {}
+        for title, value_range in zip(titles, response.get("valueRanges", [])):
+            values = value_range.get("values", [])
+            snapshot[title] = gspread.utils.fill_gaps(values) if values else []
+        return snapshot
+
+    async def _batch_get(self, titles: list[str]):
+        ranges = ["'" + title.replace("'", "''") + "'" for title in titles]
+        return await self.call("values_batch_get", self.client.http_client.values_batch_get, self.sheet_id, ranges)
+
+    async def batch_update(self, ws, data: list[dict]):
+        return await self.call("batch_update", ws.batch_update, data)
+
+    def describe(self) -> list[str]:
+        lines = [f"sheets: {self.calls} call(s), {self.retries} retries, {self.failures} failure(s), {SHEETS_MAX_WORKERS} worker(s)"]
+        for op, samples in self.latencies.items():
+            lines.append(f"sheets {op}: p50 {percentile(samples, 50):.2f}s p95 {percentile(samples, 95):.2f}s ({len(samples)} sample(s))")
+        return lines
+
+@dataclass
+class QotdQuestion:
+    row: int
+    text: str
+    status_col: str
+    used: bool = False
+
+    @property
+    def status_cell(self) -> str:
+        return f"{self.status_col}{self.row}"
+
+class QotdBank:
+    def __init__(self, tab: str):
+        self.tab = tab
+        self.worksheet = None
+        self.values: list[list[str]] = []
+        self.fingerprint: str | None = None
+        self.refreshed_at: datetime | None = None
+        self.questions: dict[int, QotdQuestion] = {}
+        self.unused: list[int] = []
+        self.positions: dict[int, int] = {}
+        self.pending: dict[str, str] = {}
+
+    @property
+    def title(self) -> str:
+        return self.worksheet.title if self.worksheet is not None else self.tab
+
+    def load(self, worksheet, values: list[list[str]], fingerprint: str):
+        self.worksheet = worksheet or self.worksheet
+        self.values = values
+        self.fingerprint = fingerprint
+        self.questions = {}
+        self.unused = []
+        self.positions = {}
+        for row_idx, row in enumerate(values[1:], start=2):
+            a = row[0].strip() if len(row) > 0 else ""
+            b = row[1].strip() if len(row) > 1 else ""
+            if b and (not a or a.startswith(("Used", "Reserved"))):
+                question = QotdQuestion(row_idx, b, "A", bool(a))
+            elif a and (not b or b.startswith(("Used", "Reserved"))):
+                question = QotdQuestion(row_idx, a, "B", bool(b))
+            elif a and b:
+                question = QotdQuestion(row_idx, b, "A", True)
+            else:
+                continue
+            self.questions[row_idx] = question
+            if not question.used:
+                self._release(row_idx)
+
+    def _release(self, row_idx: int):
+        if row_idx not in self.positions:
+            self.positions[row_idx] = len(self.unused)
+            self.unused.append(row_idx)
+
+    def _take(self, row_idx: int):
+        index = self.positions.pop(row_idx, None)
+        if index is None:
+            return
+        last = self.unused.pop()
+        if last != row_idx:
+            self.unused[index] = last
+            self.positions[last] = index
+
+    def _set_status(self, question: QotdQuestion, value: str):
+        question.used = bool(value)
+        self.pending[question.status_cell] = value
+        row = self.values[question.row - 1]
+        column = 0 if question.status_col == "A" else 1
+        row.extend([""] * (column + 1 - len(row)))
+        row[column] = value
+
+    def draw(self, status: str) -> QotdQuestion | None:
+        if not self.unused:
+            return None
+        row_idx = self.unused[pyrandom.randrange(len(self.unused))]
+        self._take(row_idx)
+        question = self.questions[row_idx]
+        self._set_status(question, status)
+        return question
+
+    def mark(self, row_idx: int, status: str):
+        question = self.questions.get(row_idx)
+        if question:
+            self._take(row_idx)
+            self._set_status(question, status)
+
+    def find(self, row_idx: int | None, text: str | None) -> QotdQuestion | None:
+        question = self.questions.get(row_idx)
+        if question and (text is None or question.text == text):
+            return question
+        if text is None:
+            return None
+        return next((q for q in self.questions.values() if q.text == text), None)
+
+    def restore(self, question: QotdQuestion):
+        self._set_status(question, "")
+        self._release(question.row)
+
+    def reset(self, keep: set[int] = frozenset()) -> int:
+        cleared = 0
+        for question in self.questions.values():
+            if question.used and question.row not in keep:
+                self.restore(question)
+                cleared += 1
+        return cleared
+
+class BirthdayRoleScheduler:
+    def __init__(self):
+        self.heap: list[tuple[float, int, int, int]] = []
+        self.tokens: dict[tuple[int, int], int] = {}
+        self.transitions = 0
+
+    def schedule(self, guild_id: int, user_id: int, when: datetime):
+        key = (guild_id, user_id)
+        token = self.tokens.get(key, 0) + 1
+        self.tokens[key] = token
+        entry = (when.timestamp(), guild_id, user_id, token)
+        heapq.heappush(self.heap, entry)
+        if self.heap[0] == entry:
+            job_scheduler.poke("birthday_checker")
+
+    def _drop_stale(self):
+        while self.heap and self.tokens.get((self.heap[0][1], self.heap[0][2])) != self.heap[0][3]:
+            heapq.heappop(self.heap)
+
+    def next_deadline(self) -> float | None:
+        self._drop_stale()
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now: float) -> tuple[int, int] | None:
+        self._drop_stale()
+        if not self.heap or self.heap[0][0] > now:
+            return None
+        _, guild_id, user_id, _ = heapq.heappop(self.heap)
+        return guild_id, user_id
+
+    def summary(self) -> str:
+        deadline = self.next_deadline()
+        upcoming = datetime.fromtimestamp(deadline, timezone.utc).isoformat() if deadline else "none"
+        return f"birthday_roles: scheduled={len(self.heap)} transitions={self.transitions} next={upcoming}"
+
+class JobLedger:
+    state_key = "job_ledger"
+
+    def __init__(self):
+        self.last_run: dict[str, dict[str, str]] | None = None
+        self.retry_at: dict[tuple[str, str], datetime] = {}
+
+    def _runs(self) -> dict[str, dict[str, str]]:
+        if self.last_run is None:
+            try:
+                data = json.loads(storage_backend.get_state(self.state_key) or "{}")
+            except ValueError:
+                data = {}
+            self.last_run = data if isinstance(data, dict) else {}
+        return self.last_run
+
+    def is_due(self, job: str, scope: str, slot: datetime, now: datetime) -> bool:
+        last = self._runs().get(job, {}).get(scope)
+        if last is None:
+            self.record(job, scope, slot)
+            return False
+        if last >= slot.date().isoformat():
+            return False
+        retry_at = self.retry_at.get((job, scope))
+        return retry_at is None or now >= retry_at
+
+    def record(self, job: str, scope: str, slot: datetime):
+        self._runs().setdefault(job, {})[scope] = slot.date().isoformat()
+        self.retry_at.pop((job, scope), None)
+        storage_backend.set_state(self.state_key, json.dumps(self.last_run))
+
+    def failed(self, job: str, scope: str, now: datetime):
+        self.retry_at[(job, scope)] = now + timedelta(seconds=DAILY_JOB_RETRY_SECONDS)
+
+    def next_retry(self, job: str) -> datetime | None:
+        return min((when for (name, _), when in self.retry_at.items() if name == job), default=None)
+
+class QotdStagingQueue:
+    state_key = "qotd_staged"
+
+    def __init__(self):
+        self.items: list[dict] | None = None
+        self.lock = asyncio.Lock()
+
+    def entries(self) -> list[dict]:
+        if self.items is None:
+            try:
+                data = json.loads(storage_backend.get_state(self.state_key) or "[]")
+            except ValueError:
+                data = []
+            self.items = [e for e in data if isinstance(e, dict) and "embed" in e] if isinstance(data, list) else []
+        return self.items
+
+    def replace(self, entries: list[dict]):
+        self.items = entries
+        storage_backend.set_state(self.state_key, json.dumps(entries))
+
+    def take(self, tab: str) -> dict | None:
+        entries = self.entries()
+        if not entries:
+            return None
+        entry = next((e for e in entries if e.get("tab") == tab), entries[0])
+        self.replace([e for e in entries if e is not entry])
+        return entry
+
+    def put_back(self, entry: dict):
+        self.replace([entry] + self.entries())
+
+class BirthdayEmbedCache:
+    def __init__(self):
+        self.pages: dict[int, list[discord.Embed]] = {}
+        self.hits = 0
+        self.renders = 0
+
+    def get(self, guild_id: int) -> list[discord.Embed] | None:
+        pages = self.pages.get(guild_id)
+        if pages is not None:
+            self.hits += 1
+        return pages
+
+    def put(self, guild_id: int, pages: list[discord.Embed]):
+        self.pages[guild_id] = pages
+        self.renders += 1
+
+    def invalidate(self, guild_id: int | None = None):
+        if guild_id is None:
+            self.pages.clear()
+        else:
+            self.pages.pop(guild_id, None)
+
+    def summary(self) -> str:
+        return f"birthday_embeds: cached_guilds={len(self.pages)} hits={self.hits} renders={self.renders}"
+
+class DebouncedWriter:
+    def __init__(self, name: str, write, delay: float):
+        self.name = name
+        self.delay = delay
+        self._write_fn = write
+        self._dirty = False
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._batch = 0
+        self._failing = 0
+        self.requested = 0
+        self.written = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    def mark_dirty(self):
+        self._dirty = True
+        self.requested += 1
+        self._batch += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        attempt = 0
+        while self._dirty:
+            delay = self.delay if attempt == 0 else min(max(self.delay, 1) * 2 ** attempt, DEBOUNCE_RETRY_MAX_SECONDS)
+            await asyncio.sleep(delay)
+            attempt = 0 if await self._write() else attempt + 1
+
+    async def _write(self) -> bool:
+        async with self._lock:
+            if not self._dirty:
+                return True
+            self._dirty = False
+            batch, self._batch = self._batch, 0
+            try:
+                await self._write_fn()
+            except Exception as e:
+                self._dirty = True
+                self._batch += batch
+                self.failures += 1
+                self._failing += 1
+                if self._failing == 1:
+                    await log_exception(f"{self.name}_write", e)
+                else:
+                    await log_to_thread(f"{self.name}_write: retry {self._failing} failed: {e!r}")
+                return False
+            if self._failing:
+                await log_to_thread(f"{self.name}_write: recovered after {self._failing} failed attempt(s).")
+            self._failing = 0
+            self.written += 1
+            self.coalesced += max(0, batch - 1)
+            return True
+
+    async def flush(self) -> bool:
+        return await self._write()
+
+    def summary(self) -> str:
+        return f"{self.name}: requested={self.requested} written={self.written} coalesced={self.coalesced} failures={self.failures}"
+
+class ShardedMessageStore:
+    def __init__(self, prefix: str, legacy_prefix: str):
+        self.prefix = prefix
+        self.legacy_prefix = legacy_prefix
+        self.message_ids: list[int] = []
+        self.contents: list[str] = []
+        self.seq = 0
+        self._found: dict[int, dict[int, tuple[int, int]]] = {}
+        self._lock = asyncio.Lock()
+
+    def reset(self):
+        self.message_ids = []
+        self.contents = []
+        self.seq = 0
+        self._found = {}
+
+    def is_legacy(self, content: str) -> bool:
+        content = (content or "").strip()
+        if not content.startswith(self.legacy_prefix):
+            return False
+        return content[len(self.legacy_prefix):].strip().startswith("{")
+
+    def _complete_sets(self) -> list[dict[int, tuple[int, int]]]:
+        return [shards for total, shards in self._found.items() if len(shards) == total]
+
+    def is_complete(self) -> bool:
+        return bool(self._complete_sets())
+
+    async def validate(self, channel, message_ids: list[int]) -> bool:
+        if not message_ids:
+            return False
+        try:
+            msg = await channel.fetch_message(message_ids[0])
+        except discord.HTTPException:
+            return False
+        parsed = self.parse(msg.content)
+        if parsed is None:
+            valid = len(message_ids) == 1 and self.is_legacy(msg.content)
+            seqs = [0]
+        else:
+            index, total, seq, _ = parsed
+            valid = index == 0 and total == len(message_ids)
+            seqs = [seq]
+        for i, msg_id in enumerate(message_ids[1:], start=1):
+            if not valid:
+                break
+            try:
+                msg = await channel.fetch_message(msg_id)
+            except discord.HTTPException:
+                return False
+            parsed = self.parse(msg.content)
+            valid = parsed is not None and parsed[0] == i and parsed[1] == len(message_ids)
+            if valid:
+                seqs.append(parsed[2])
+        if valid:
+            self.message_ids = list(message_ids)
+            self.contents = []
+            self.seq = max(seqs)
+        return valid
+
+    def parse(self, content: str) -> tuple[int, int, int, str] | None:
+        content = (content or "").strip()
+        if not content.startswith(self.prefix + "["):
+            return None
+        head, _, body = content.partition("\n")
+        try:
+            close = head.index("]")
+            index_part, total_part = head[len(self.prefix) + 1:close].split("/")
+            index, total = int(index_part) - 1, int(total_part)
+            seq = int(head[close + 2:]) if head[close + 1:close + 2] == "@" else 0
+        except ValueError:
+            return None
+        if not 0 <= index < total:
+            return None
+        return index, total, seq, body
+
+    def collect(self, msg: discord.Message) -> bool:
+        parsed = self.parse(msg.content)
+        if parsed is None:
+            return False
+        index, total, seq, _ = parsed
+        self._found.setdefault(total, {}).setdefault(index, (msg.id, seq))
+        return True
+
+    def resolve(self, legacy_id: int | None) -> bool:
+        complete = self._complete_sets()
+        if complete:
+            shards = min(complete, key=lambda found: found[0][0])
+            self.message_ids = [shards[i][0] for i in range(len(shards))]
+            self.seq = max(seq for _, seq in shards.values())
+        elif legacy_id is not None:
+            self.message_ids = [legacy_id]
+            self.seq = 0
+        else:
+            self.message_ids = []
+        self.contents = []
+        return bool(self.message_ids)
+
+    def split(self, text: str) -> list[str]:
+        size = STORAGE_SHARD_CHARS - len(self.prefix) - 48
+        chunks = []
+        start = 0
+        while start < len(text):
+            end = min(start + size, len(text))
+            while start + 1 < end < len(text) and (text[end - 1].isspace() or text[end].isspace()):
+                end -= 1
+            chunks.append(text[start:end])
+            start = end
+        return chunks or [""]
+
+    async def load(self, channel) -> str:
+        parts = []
+        contents = []
+        seqs = [0]
+        total = len(self.message_ids)
+        for i, msg_id in enumerate(self.message_ids):
+            msg = await channel.fetch_message(msg_id)
+            content = msg.content or ""
+            contents.append(content)
+            parsed = self.parse(content)
+            if parsed is None:
+                if total != 1:
+                    raise ValueError(f"{self.prefix} shard {msg_id} has no shard header")
+                body = content.strip()
+                if self.legacy_prefix and body.startswith(self.legacy_prefix):
+                    body = body[len(self.legacy_prefix):]
+                parts.append(body)
+                continue
+            index, shard_total, seq, body = parsed
+            if index != i or shard_total != total:
+                raise ValueError(f"{self.prefix} shard {msg_id} is {index + 1}/{shard_total}, expected {i + 1}/{total}")
+            seqs.append(seq)
+            parts.append(body)
+        self.contents = contents
+        self.seq = max(seqs)
+        return "".join(parts)
+
+    async def save(self, channel, text: str, seq: int | None = None):
+        async with self._lock:
+            seq = self.seq if seq is None else seq
+            chunks = self.split(text)
+            total = len(chunks)
+            current = [self.parse(c) for c in self.contents] if len(self.contents) == len(self.message_ids) else []
+            ids = []
+            contents = []
+            seqs = []
+            sent = []
+            try:
+                for i, chunk in enumerate(chunks):
+                    parsed = current[i] if i < len(current) else None
+                    if parsed is not None and parsed[1] == total and parsed[3] == chunk:
+                        ids.append(self.message_ids[i])
+                        contents.append(self.contents[i])
+                        seqs.append(parsed[2])
+                        continue
+                    content = f"{self.prefix}[{i + 1}/{total}]@{seq}\n{chunk}"
+                    msg = await channel.send(content, allowed_mentions=discord.AllowedMentions.none())
+                    sent.append(msg.id)
+                    ids.append(msg.id)
+                    contents.append(content)
+                    seqs.append(seq)
+            except Exception:
+                for msg_id in sent:
+                    try:
+                        await channel.get_partial_message(msg_id).delete()
+                    except discord.HTTPException:
+                        pass
+                raise
+            if not sent and total == len(self.message_ids):
+                return
+            replaced = [msg_id for msg_id in self.message_ids if msg_id not in ids]
+            self.message_ids = ids
+            self.contents = contents
+            self.seq = max(seqs)
+            remember_storage_message_ids()
+            for msg_id in replaced:
+                try:
+                    await channel.get_partial_message(msg_id).delete()
+                except discord.NotFound:
+                    pass
+                except discord.HTTPException as e:
+                    await log_exception(f"{self.prefix.lower()}_shard_delete", e)
+
+class StorageJournal:
+    prefix = "JOURNAL"
+
+    def __init__(self):
+        self.message_ids: list[int] = []
+        self.contents: list[str] = []
+        self.records: list[dict] = []
+        self.pending: list[dict] = []
+        self.seq = 0
+        self.appended = 0
+        self.compactions = 0
+        self._found: list[tuple[int, int]] = []
+        self._lock = asyncio.Lock()
+
+    def reset(self):
+        self.message_ids = []
+        self.contents = []
+        self.records = []
+        self._found = []
+
+    def parse(self, content: str) -> tuple[int, list[dict]] | None:
+        content = (content or "").strip()
+        if not content.startswith(self.prefix + "["):
+            return None
+        head, _, body = content.partition("\n")
+        try:
+            first_seq = int(head[len(self.prefix) + 1:head.index("]")])
+        except ValueError:
+            return None
+        records = []
+        for line in body.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and isinstance(record.get("s"), int):
+                records.append(record)
+        return first_seq, records
+
+    def collect(self, msg: discord.Message) -> bool:
+        parsed = self.parse(msg.content)
+        if parsed is None:
+            return False
+        self._found.append((parsed[0], msg.id))
+        return True
+
+    def resolve(self) -> list[int]:
+        return [msg_id for _, msg_id in sorted(self._found)]
+
+    async def load(self, channel, message_ids: list[int]) -> bool:
+        contents = []
+        records = []
+        for msg_id in message_ids:
+            try:
+                msg = await channel.fetch_message(msg_id)
+            except discord.NotFound:
+                return False
+            parsed = self.parse(msg.content)
+            if parsed is None:
+                return False
+            contents.append(msg.content)
+            records.extend(parsed[1])
+        self.message_ids = list(message_ids)
+        self.contents = contents
+        self.records = sorted(records, key=lambda r: r["s"])
+        return True
+
+    def sync_seq(self, *snapshot_seqs: int):
+        self.seq = max([self.seq, *snapshot_seqs, *(r["s"] for r in self.records)])
+
+    def record(self, op: str, **fields) -> dict:
+        self.seq += 1
+        entry = {"s": self.seq, "op": op, **fields}
+        self.pending.append(entry)
+        return entry
+
+    def discard(self, records: list[dict]):
+        ids = {id(r) for r in records}
+        self.pending = [r for r in self.pending if id(r) not in ids]
+
+    def replay(self, data: dict, ops: tuple[str, ...], after_seq: int, apply) -> dict:
+        for entry in self.records:
+            if entry["s"] > after_seq and entry.get("op") in ops:
+                try:
+                    apply(data, entry)
+                except (KeyError, IndexError, TypeError, ValueError):
+                    continue
+        return data
+
+    async def _append(self, channel, records: list[dict]):
+        ids = list(self.message_ids)
+        contents = list(self.contents)
+        last_dirty = False
+        new_contents = []
+        for entry in records:
+            line = json.dumps(entry, separators=(",", ":"))
+            if new_contents and len(new_contents[-1]) + 1 + len(line) <= STORAGE_SHARD_CHARS:
+                new_contents[-1] += "\n" + line
+            elif not new_contents and contents and len(contents[-1]) + 1 + len(line) <= STORAGE_SHARD_CHARS:
+                contents[-1] += "\n" + line
+                last_dirty = True
+            else:
+                new_contents.append(f"{self.prefix}[{entry['s']}]\n{line}")
+        if last_dirty and not await edit_message_by_id(channel, ids[-1], content=contents[-1], allowed_mentions=discord.AllowedMentions.none()):
+            msg = await channel.send(contents[-1], allowed_mentions=discord.AllowedMentions.none())
+            ids[-1] = msg.id
+        for content in new_contents:
+            msg = await channel.send(content, allowed_mentions=discord.AllowedMentions.none())
+            ids.append(msg.id)
+            contents.append(content)
+            self.message_ids = list(ids)
+            self.contents = list(contents)
+        self.message_ids = ids
+        self.contents = contents
+
+    async def flush(self):
+        async with self._lock:
+            if not self.pending:
+                return
+            channel = bot.get_channel(BIRTHDAY_STORAGE_CHANNEL_ID)
+            if not channel:
+                raise RuntimeError("Storage channel is not available for the journal.")
+            records = self.pending
+            self.pending = []
+            compact = len(self.records) + len(records) >= JOURNAL_COMPACT_RECORDS and birthday_storage_loaded and pool_storage_loaded
+            try:
+                if compact:
+                    await self._compact(channel)
+                else:
+                    await self._append(channel, records)
+            except Exception:
+                self.pending = records + self.pending
+                raise
+            finally:
+                remember_storage_message_ids()
+            if not compact:
+                self.records.extend(records)
+                self.appended += len(records)
+
+    async def compact(self):
+        async with self._lock:
+            channel = bot.get_channel(BIRTHDAY_STORAGE_CHANNEL_ID)
+            if not channel:
+                raise RuntimeError("Storage channel is not available for the journal.")
+            await self._compact(channel)
+
+    async def _compact(self, channel):
+        seq = self.seq
+        birthday_text = _encode_birthday_document(build_birthday_document(birthday_data))
+        pool_text = _encode_pool_document(build_pool_document())
+        await birthday_shards.save(channel, birthday_text, seq)
+        await pool_shards.save(channel, pool_text, seq)
+        for msg_id in self.message_ids:
+            try:
+                await channel.get_partial_message(msg_id).delete()
+            except discord.NotFound:
+                pass
+        self.message_ids = []
+        self.contents = []
+        self.records = [r for r in self.records if r["s"] > seq]
+        self.compactions += 1
+        remember_storage_message_ids()
+        await log_to_thread(f"StorageJournal: compacted journal into snapshot seq={seq}.")
+
+    def summary(self) -> str:
+        return f"storage_journal: seq={self.seq} records={len(self.records)} pending={len(self.pending)} appended={self.appended} compactions={self.compactions}"
+
+class StorageBackend:
+    name = "base"
+
+    async def open(self):
+        return None
+
+    async def load_birthdays(self) -> dict[int, GuildBirthdays] | None:
+        raise NotImplementedError
+
+    async def save_birthday_changes(self, guild_id: int, birthdays: dict[int, tuple[str, str | None] | None], public_location: tuple[int, int] | None):
+        raise NotImplementedError
+
+    async def load_pool(self) -> dict[int, GuildPool] | None:
+        raise NotImplementedError
+
+    async def save_pool(self, guild_id: int, ops: list[tuple[str, dict]]):
+        raise NotImplementedError
+
+    async def picks_by_user(self, guild_id: int, user_id: int) -> list[str]:
+        raise NotImplementedError
+
+    def get_state(self, key: str) -> str | None:
+        raise NotImplementedError
+
+    def set_state(self, key: str, value: str):
+        raise NotImplementedError
+
+    def describe(self) -> str:
+        return self.name
+
+class MessageStorageBackend(StorageBackend):
+    name = "message"
+
+    def __init__(self, state_path: str):
+        self.state_path = state_path
+        self._state: dict | None = None
+
+    def _load_state(self) -> dict:
+        if self._state is None:
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._state = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._state = {}
+        return self._state
+
+    def get_state(self, key: str) -> str | None:
+        value = self._load_state().get(key)
+        return value if isinstance(value, str) else None
+
+    def set_state(self, key: str, value: str):
+        state = self._load_state()
+        state[key] = value
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    async def load_birthdays(self) -> dict[int, GuildBirthdays] | None:
+        return await _load_storage_message()
+
+    async def save_birthday_changes(self, guild_id: int, birthdays: dict[int, tuple[str, str | None] | None], public_location: tuple[int, int] | None):
+        records = journal_birthday_changes(guild_id, birthdays, public_location)
+        try:
+            await storage_journal.flush()
+        except Exception:
+            storage_journal.discard(records)
+            raise
+
+    async def load_pool(self) -> dict[int, GuildPool] | None:
+        return await _load_pool_message()
+
+    async def save_pool(self, guild_id: int, ops: list[tuple[str, dict]]):
+        for op, fields in ops:
+            storage_journal.record(op, **fields)
+        journal_writer.mark_dirty()
+
+    async def picks_by_user(self, guild_id: int, user_id: int) -> list[str]:
+        return [title for uid, title in request_pool.get(guild_id, []) if uid == user_id]
+
+class SQLiteStorageBackend(StorageBackend):
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn: sqlite3.Connection | None = None
+
+    async def open(self):
+        if self.conn is not None:
+            return
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS birthdays (guild_id INTEGER NOT NULL, user_id INTEGER NOT NULL, mm_dd TEXT NOT NULL, timezone TEXT, PRIMARY KEY (guild_id, user_id));
+            CREATE TABLE IF NOT EXISTS public_messages (guild_id INTEGER NOT NULL, kind TEXT NOT NULL, channel_id INTEGER NOT NULL, message_id INTEGER NOT NULL, PRIMARY KEY (guild_id, kind));
+            CREATE TABLE IF NOT EXISTS pool_entries (guild_id INTEGER NOT NULL, position INTEGER NOT NULL, user_id INTEGER NOT NULL, title TEXT NOT NULL, PRIMARY KEY (guild_id, position));
+            CREATE INDEX IF NOT EXISTS pool_entries_by_user ON pool_entries (guild_id, user_id);
+            """
+        )
+        if "timezone" not in {row[1] for row in conn.execute("PRAGMA table_info(birthdays)")}:
+            conn.execute("ALTER TABLE birthdays ADD COLUMN timezone TEXT")
+        conn.commit()
+        self.conn = conn
+
+    def get_state(self, key: str) -> str | None:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key: str, value: str):
+        with self.conn:
+            self.conn.execute("INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, value))
+
+    def _mirror_required(self) -> bool:
+        return BIRTHDAY_STORAGE_CHANNEL_ID != 0
+
+    def _mirror_active(self) -> bool:
+        return STORAGE_MIRROR_ENABLED and self._mirror_required() and bot.get_channel(BIRTHDAY_STORAGE_CHANNEL_ID) is not None
+
+    async def _hydrate_birthdays(self) -> bool:
+        data = await _load_storage_message()
+        if data is None:
+            if self._mirror_required():
+                return False
+            data = {}
+        with self.conn:
+            for gid, entry in data.items():
+                self.conn.executemany("INSERT OR REPLACE INTO birthdays (guild_id, user_id, mm_dd, timezone) VALUES (?, ?, ?, ?)", [(gid, uid, mm_dd, entry.timezones.get(uid)) for uid, mm_dd in entry.birthdays.items()])
+                if entry.public_message:
+                    self.conn.execute("INSERT OR REPLACE INTO public_messages (guild_id, kind, channel_id, message_id) VALUES (?, 'birthday', ?, ?)", (gid, *entry.public_message))
+        self.set_state("birthdays_hydrated", datetime.now(timezone.utc).isoformat())
+        await log_to_thread(f"SQLiteStorageBackend: imported birthdays for {len(data)} guild(s) from the storage messages.")
+        return True
+
+    async def _hydrate_pool(self) -> bool:
+        raw = await _load_pool_message()
+        if raw is None:
+            if self._mirror_required():
+                return False
+            raw = {}
+        with self.conn:
+            for gid, pool in raw.items():
+                self.conn.executemany("INSERT OR REPLACE INTO pool_entries (guild_id, position, user_id, title) VALUES (?, ?, ?, ?)", [(gid, position, uid, title) for position, (uid, title) in enumerate(pool.entries)])
+                if pool.message:
+                    self.conn.execute("INSERT OR REPLACE INTO public_messages (guild_id, kind, channel_id, message_id) VALUES (?, 'pool', ?, ?)", (gid, *pool.message))
+        self.set_state("pool_hydrated", datetime.now(timezone.utc).isoformat())
+        await log_to_thread(f"SQLiteStorageBackend: imported pools for {len(raw)} guild(s) from the storage messages.")
+        return True
+
+    async def load_birthdays(self) -> dict[int, GuildBirthdays] | None:
+        if self.get_state("birthdays_hydrated") is None and not await self._hydrate_birthdays():
+            return None
+        data: dict[int, GuildBirthdays] = {}
+        for gid, uid, mm_dd, tz in self.conn.execute("SELECT guild_id, user_id, mm_dd, timezone FROM birthdays"):
+            data.setdefault(gid, GuildBirthdays()).add(uid, mm_dd, tz)
+        for gid, ch_id, msg_id in self.conn.execute("SELECT guild_id, channel_id, message_id FROM public_messages WHERE kind = 'birthday'"):
+            data.setdefault(gid, GuildBirthdays()).public_message = (ch_id, msg_id)
+        return data
+
+    async def save_birthday_changes(self, guild_id: int, birthdays: dict[int, tuple[str, str | None] | None], public_location: tuple[int, int] | None):
+        with self.conn:
+            for user_id, change in birthdays.items():
+                if change is None:
+                    self.conn.execute("DELETE FROM birthdays WHERE guild_id = ? AND user_id = ?", (guild_id, user_id))
+                else:
+                    self.conn.execute("INSERT INTO birthdays (guild_id, user_id, mm_dd, timezone) VALUES (?, ?, ?, ?) ON CONFLICT(guild_id, user_id) DO UPDATE SET mm_dd = excluded.mm_dd, timezone = excluded.timezone", (guild_id, user_id, *change))
+            if public_location is not None:
+                self.conn.execute("INSERT OR REPLACE INTO public_messages (guild_id, kind, channel_id, message_id) VALUES (?, 'birthday', ?, ?)", (guild_id, public_location[0], public_location[1]))
+        if self._mirror_active():
+            journal_birthday_changes(guild_id, birthdays, public_location)
+            journal_writer.mark_dirty()
+
+    async def load_pool(self) -> dict[int, GuildPool] | None:
+        if self.get_state("pool_hydrated") is None and not await self._hydrate_pool():
+            return None
+        data: dict[int, GuildPool] = {}
+        for gid, uid, title in self.conn.execute("SELECT guild_id, user_id, title FROM pool_entries ORDER BY guild_id, position"):
+            data.setdefault(gid, GuildPool()).entries.append((uid, title))
+        for gid, ch_id, msg_id in self.conn.execute("SELECT guild_id, channel_id, message_id FROM public_messages WHERE kind = 'pool'"):
+            data.setdefault(gid, GuildPool()).message = (ch_id, msg_id)
+        return data
+
+    async def save_pool(self, guild_id: int, ops: list[tuple[str, dict]]):
+        with self.conn:
+            self.conn.execute("DELETE FROM pool_entries WHERE guild_id = ?", (guild_id,))
+            self.conn.executemany(
+                "INSERT INTO pool_entries (guild_id, position, user_id, title) VALUES (?, ?, ?, ?)",
+                [(guild_id, position, uid, title) for position, (uid, title) in enumerate(request_pool.get(guild_id, []))],
+            )
+            loc = pool_message_locations.get(guild_id)
+            if loc:
+                self.conn.execute("INSERT OR REPLACE INTO public_messages (guild_id, kind, channel_id, message_id) VALUES (?, 'pool', ?, ?)", (guild_id, loc[0], loc[1]))
+        if self._mirror_active():
+            for op, fields in ops:
+                storage_journal.record(op, **fields)
+            journal_writer.mark_dirty()
+
+    async def picks_by_user(self, guild_id: int, user_id: int) -> list[str]:
+        return [row[0] for row in self.conn.execute("SELECT title FROM pool_entries WHERE guild_id = ? AND user_id = ? ORDER BY position", (guild_id, user_id))]
+
+    def describe(self) -> str:
+        return f"sqlite path={self.path} mirror={'on' if STORAGE_MIRROR_ENABLED and self._mirror_required() else 'off'}"
+
+class BirthdayConflict(Exception):
+    pass
+
+class BirthdayTransaction:
+    def __init__(self, guild_id: int, entry: GuildBirthdays):
+        self.guild_id = guild_id
+        self.entry = entry
+        self.birthdays: dict[int, tuple[str, str | None] | None] = {}
+        self.public_location: tuple[int, int] | None = None
+        self.changes = 0
+
+    def set(self, user_id: int, mm_dd: str, tz: str | None = None) -> bool:
+        self.entry.add(user_id, mm_dd, tz)
+        self.birthdays[user_id] = (mm_dd, tz)
+        self.changes += 1
+        return True
+
+    def remove(self, user_id: int) -> bool:
+        if not self.entry.remove(user_id):
+            return False
+        self.birthdays[user_id] = None
+        self.changes += 1
+        return True
+
+    def set_public_location(self, channel_id: int, message_id: int) -> bool:
+        self.entry.public_message = (channel_id, message_id)
+        self.public_location = (channel_id, message_id)
+        self.changes += 1
+        return True
+
+class BirthdayTransactionManager:
+    def __init__(self, window: float):
+        self.window = window
+        self.versions: dict[int, int] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._pending: dict[int, list] = {}
+        self.commits = 0
+        self.operations = 0
+
+    def version(self, guild_id: int) -> int:
+        return self.versions.get(guild_id, 0)
+
+    async def run(self, guild_id: int, mutate, expected_version: int | None = None):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.get(guild_id)
+        if batch is None:
+            batch = self._pending[guild_id] = []
+            loop.create_task(self._commit(guild_id))
+        batch.append((mutate, expected_version, future))
+        return await future
+
+    async def _commit(self, guild_id: int):
+        await asyncio.sleep(self.window)
+        lock = self._locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            batch = self._pending.pop(guild_id, [])
+            had_entry = guild_id in birthday_data
+            snapshot = copy.deepcopy(birthday_data.get(guild_id))
+            start_version = self.version(guild_id)
+            txn = BirthdayTransaction(guild_id, birthday_data.setdefault(guild_id, GuildBirthdays()))
+            outcomes = []
+            for mutate, expected_version, future in batch:
+                if expected_version is not None and expected_version != self.version(guild_id):
+                    outcomes.append((future, BirthdayConflict(f"guild {guild_id} is at version {self.version(guild_id)}, expected {expected_version}"), True))
+                    continue
+                before = txn.changes
+                try:
+                    outcomes.append((future, mutate(txn), False))
+                except Exception as e:
+                    outcomes.append((future, e, True))
+                    continue
+                if txn.changes != before:
+                    self.versions[guild_id] = self.version(guild_id) + 1
+            self.operations += len(batch)
+            try:
+                if txn.changes:
+                    await storage_backend.save_birthday_changes(guild_id, txn.birthdays, txn.public_location)
+                    self.commits += 1
+            except Exception as e:
+                if had_entry:
+                    birthday_data[guild_id] = snapshot
+                else:
+                    birthday_data.pop(guild_id, None)
+                birthday_embeds.invalidate(guild_id)
+                self.versions[guild_id] = start_version
+                for future, _, _ in outcomes:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            now = datetime.now(timezone.utc)
+            for user_id in txn.birthdays:
+                birthday_roles.schedule(guild_id, user_id, now)
+            if txn.birthdays:
+                birthday_embeds.invalidate(guild_id)
+            for future, value, failed in outcomes:
+                if future.done():
+                    continue
+                if failed:
+                    future.set_exception(value)
+                else:
+                    future.set_result(value)
+
+    def summary(self) -> str:
+        return f"birthday_transactions: operations={self.operations} commits={self.commits} guilds={len(self.versions)}"
+
+birthday_shards = ShardedMessageStore("BIRTHDAY_DATA", "")
+pool_shards = ShardedMessageStore("POOL_DATA", "POOL_DATA:")
 pool_message_locations: dict[int, tuple[int, int]] = {}
 movie_titles: list[dict] = []
+movie_library_fingerprint: str | None = None
+qotd_banks: dict[str, QotdBank] = {}
+qotd_staging = QotdStagingQueue()
 request_pool: dict[int, list[tuple[int, str]]] = {}
+birthday_data: dict[int, GuildBirthdays] = {}
+storage_migrations: list[str] = []
+birthday_storage_loaded: bool = False
+pool_storage_loaded: bool = False
 startup_logging_done: bool = False
+startup_complete: bool = False
 startup_log_buffer = []
+storage_journal = StorageJournal()
+journal_writer = DebouncedWriter("storage_journal", lambda: storage_journal.flush(), STORAGE_MIRROR_DEBOUNCE_SECONDS if STORAGE_BACKEND == "sqlite" else POOL_SAVE_DEBOUNCE_SECONDS)
+birthday_transactions = BirthdayTransactionManager(BIRTHDAY_TXN_WINDOW_MS / 1000)
+birthday_roles = BirthdayRoleScheduler()
+birthday_embeds = BirthdayEmbedCache()
+job_ledger = JobLedger()
+job_metrics = JobMetrics(JOB_METRICS_HISTORY)
+sheets = SheetsClient(gc, SHEET_ID)
+job_scheduler = JobScheduler()
+task_registry = TaskRegistry()
+storage_backend: StorageBackend = SQLiteStorageBackend(STORAGE_DB_PATH) if STORAGE_BACKEND == "sqlite" else MessageStorageBackend(STORAGE_STATE_PATH)
 
 
 ############### HELPER FUNCTIONS ###############
@@ -144,6 +1553,13 @@ async def log_to_thread(content: str):
     except Exception:
         pass
 
+async def edit_message_by_id(channel, message_id: int, **fields) -> bool:
+    try:
+        await channel.get_partial_message(message_id).edit(**fields)
+    except discord.NotFound:
+        return False
+    return True
+
 async def log_exception(tag: str, exc: Exception):
     tb = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
     text = f"@everyone {tag}: {exc}\n{tb}"
@@ -152,8 +1568,6 @@ async def log_exception(tag: str, exc: Exception):
     await log_to_thread(text)
 
 async def run_startup_checks():
-    global storage_message_id, pool_storage_message_id
-
     lines = []
 
     lines.append("[LOGGING]")
@@ -167,48 +1581,42 @@ async def run_startup_checks():
     lines.append("")
 
     lines.append("[STORAGE]")
+    lines.append(f"`✅` Storage backend: {storage_backend.describe()}")
+    lines.append(f"`✅` Storage journal: {len(storage_journal.records)} record(s) on top of snapshot seq={max(birthday_shards.seq, pool_shards.seq)}")
 
-    storage_ok = False
-    try:
-        data = await _load_storage_message()
-        storage_ok = isinstance(data, dict)
-    except Exception as e:
-        await log_exception("startup_check_storage", e)
-        storage_ok = False
+    storage_ok = birthday_storage_loaded and isinstance(birthday_data, dict)
     if storage_ok:
         lines.append("`✅` Birthday storage data")
     else:
         lines.append("`⚠️` Birthday storage data could not be loaded or parsed")
+    if is_valid_timezone(BIRTHDAY_DEFAULT_TIMEZONE):
+        lines.append(f"`✅` Birthday role schedule (default timezone {BIRTHDAY_DEFAULT_TIMEZONE}; {birthday_roles.summary()})")
+    else:
+        lines.append(f"`⚠️` BIRTHDAY_DEFAULT_TIMEZONE {BIRTHDAY_DEFAULT_TIMEZONE!r} is unknown; falling back to UTC")
 
     birthday_storage_binding_ok = (
-        storage_message_id is not None
+        bool(birthday_shards.message_ids)
         and BIRTHDAY_STORAGE_CHANNEL_ID != 0
         and bot.get_channel(BIRTHDAY_STORAGE_CHANNEL_ID) is not None
     )
     if birthday_storage_binding_ok:
-        lines.append(f"`✅` Birthday storage message binding (msg_id={storage_message_id}, channel_id={BIRTHDAY_STORAGE_CHANNEL_ID})")
+        lines.append(f"`✅` Birthday storage message binding (msg_ids={birthday_shards.message_ids}, channel_id={BIRTHDAY_STORAGE_CHANNEL_ID})")
     else:
         lines.append("`⚠️` Birthday storage message binding missing or inaccessible")
 
-    pool_ok = False
-    try:
-        pool = await _load_pool_message()
-        pool_ok = isinstance(pool, dict)
-    except Exception as e:
-        await log_exception("startup_check_pool", e)
-        pool_ok = False
+    pool_ok = pool_storage_loaded and isinstance(request_pool, dict)
     if pool_ok:
         lines.append("`✅` Pool storage data")
     else:
         lines.append("`⚠️` Pool storage data could not be loaded or parsed")
 
     pool_storage_binding_ok = (
-        pool_storage_message_id is not None
+        bool(pool_shards.message_ids)
         and BIRTHDAY_STORAGE_CHANNEL_ID != 0
         and bot.get_channel(BIRTHDAY_STORAGE_CHANNEL_ID) is not None
     )
     if pool_storage_binding_ok:
-        lines.append(f"`✅` Pool storage message binding (msg_id={pool_storage_message_id}, channel_id={BIRTHDAY_STORAGE_CHANNEL_ID})")
+        lines.append(f"`✅` Pool storage message binding (msg_ids={pool_shards.message_ids}, channel_id={BIRTHDAY_STORAGE_CHANNEL_ID})")
     else:
         lines.append("`⚠️` Pool storage message binding missing or inaccessible")
 
@@ -221,7 +1629,7 @@ async def run_startup_checks():
     lines.append("")
     lines.append("[QOTD / MEDIA]")
 
-    sheets_ok = gc is not None and bool(SHEET_ID)
+    sheets_ok = sheets.enabled
     if sheets_ok:
         lines.append("`✅` Google Sheets client")
     else:
@@ -241,6 +1649,11 @@ async def run_startup_checks():
         lines.append("`✅` QOTD channel")
     else:
         lines.append("`⚠️` QOTD channel not found")
+    staged = len(qotd_staging.entries())
+    if staged:
+        lines.append(f"`✅` QOTD staged questions ({staged} ready)")
+    else:
+        lines.append("`⚠️` No QOTD staged yet; the next post will read Google Sheets directly")
 
     rating_channel = bot.get_channel(RATING_CHANNEL_ID) if RATING_CHANNEL_ID else None
     if rating_channel:
@@ -335,145 +1748,448 @@ async def run_startup_checks():
         text = text[:1900]
     await log_to_thread(text)
     
+async def flush_pending_writes():
+    try:
+        if not await journal_writer.flush():
+            print(f"storage_journal flush failed; {len(storage_journal.pending)} record(s) not written")
+    except Exception as e:
+        print("storage_journal flush error:", repr(e))
+    for tab, bank in qotd_banks.items():
+        try:
+            if not await flush_qotd_bank(bank):
+                print(f"qotd bank '{tab}' flush failed; {len(bank.pending)} status cell(s) not written")
+        except Exception as e:
+            print(f"qotd bank '{tab}' flush error:", repr(e))
+    print(journal_writer.summary())
+    print(storage_journal.summary())
+
+def birthday_zone(name: str | None) -> tzinfo:
+    for candidate in (name, BIRTHDAY_DEFAULT_TIMEZONE):
+        if candidate:
+            try:
+                return ZoneInfo(candidate)
+            except (ZoneInfoNotFoundError, ValueError):
+                continue
+    return timezone.utc
+
+def is_valid_timezone(name: str) -> bool:
+    try:
+        ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return False
+    return True
+
+def birthday_transition(mm_dd: str, tz_name: str | None, now: datetime) -> tuple[bool, datetime | None]:
+    zone = birthday_zone(tz_name)
+    today = now.astimezone(zone).date()
+    month, day = (int(part) for part in mm_dd.split("-"))
+    for year in range(today.year, today.year + 9):
+        try:
+            start = date(year, month, day)
+        except ValueError:
+            continue
+        if start == today:
+            return True, datetime.combine(today + timedelta(days=1), time(0), tzinfo=zone)
+        if start > today:
+            return False, datetime.combine(start, time(0), tzinfo=zone)
+    return False, None
+
 def build_mm_dd(month_name: str, day: int) -> str | None:
     month_num = MONTH_TO_NUM.get(month_name)
     if not month_num or not (1 <= day <= 31):
         return None
     return f"{month_num}-{day:02d}"
 
+def _write_varint(out: bytearray, value: int):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+def _pack_value(out: bytearray, value):
+    if value is None:
+        out.append(0)
+    elif value is False:
+        out.append(1)
+    elif value is True:
+        out.append(2)
+    elif isinstance(value, int):
+        out.append(3 if value >= 0 else 4)
+        _write_varint(out, abs(value))
+    elif isinstance(value, float):
+        raw = repr(value).encode("ascii")
+        out.append(10)
+        _write_varint(out, len(raw))
+        out += raw
+    elif isinstance(value, str):
+        if value.isdigit() and value.isascii() and str(int(value)) == value:
+            out.append(6)
+            _write_varint(out, int(value))
+        elif len(value) == 5 and value[2] == "-" and value[:2].isdigit() and value[3:].isdigit() and value.isascii():
+            out.append(7)
+            out.append(int(value[:2]))
+            out.append(int(value[3:]))
+        else:
+            raw = value.encode("utf-8")
+            out.append(5)
+            _write_varint(out, len(raw))
+            out += raw
+    elif isinstance(value, (list, tuple)):
+        out.append(8)
+        _write_varint(out, len(value))
+        for item in value:
+            _pack_value(out, item)
+    elif isinstance(value, dict):
+        out.append(9)
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            _pack_value(out, str(key))
+            _pack_value(out, item)
+    else:
+        raise TypeError(f"Cannot pack {type(value).__name__}")
+
+def _unpack_value(data: bytes, pos: int):
+    tag = data[pos]
+    pos += 1
+    if tag in (0, 1, 2):
+        return (None, False, True)[tag], pos
+    if tag in (3, 4):
+        value, pos = _read_varint(data, pos)
+        return (value if tag == 3 else -value), pos
+    if tag in (5, 10):
+        length, pos = _read_varint(data, pos)
+        raw = data[pos:pos + length].decode("utf-8")
+        return (raw if tag == 5 else float(raw)), pos + length
+    if tag == 6:
+        value, pos = _read_varint(data, pos)
+        return str(value), pos
+    if tag == 7:
+        return f"{data[pos]:02d}-{data[pos + 1]:02d}", pos + 2
+    if tag == 8:
+        count, pos = _read_varint(data, pos)
+        items = []
+        for _ in range(count):
+            item, pos = _unpack_value(data, pos)
+            items.append(item)
+        return items, pos
+    if tag == 9:
+        count, pos = _read_varint(data, pos)
+        obj = {}
+        for _ in range(count):
+            key, pos = _unpack_value(data, pos)
+            obj[key], pos = _unpack_value(data, pos)
+        return obj, pos
+    raise ValueError(f"Unknown storage tag {tag}")
+
+def encode_storage_payload(data: dict) -> str:
+    out = bytearray()
+    _pack_value(out, data)
+    return STORAGE_FORMAT_MARKER + base64.b85encode(zlib.compress(bytes(out), 9)).decode("ascii")
+
+def decode_storage_payload(text: str) -> dict:
+    text = (text or "").strip()
+    if text.startswith(STORAGE_FORMAT_MARKER):
+        raw = zlib.decompress(base64.b85decode(text[len(STORAGE_FORMAT_MARKER):]))
+        data, _ = _unpack_value(raw, 0)
+    else:
+        data = json.loads(text or "{}")
+    return data if isinstance(data, dict) else {}
+
+def _storage_location(info) -> dict | None:
+    if not isinstance(info, dict):
+        return None
+    try:
+        return {"channel_id": int(info["channel_id"]), "message_id": int(info["message_id"])}
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def _birthdays_v0_to_v1(raw: dict) -> dict:
+    migrated = {}
+    for gid, entry in raw.items():
+        if not str(gid).isdigit() or not isinstance(entry, dict):
+            continue
+        birthdays = entry["birthdays"] if isinstance(entry.get("birthdays"), dict) else entry
+        guild = {"birthdays": {str(uid): mm_dd for uid, mm_dd in birthdays.items() if str(uid).isdigit() and isinstance(mm_dd, str)}}
+        location = _storage_location(entry.get("public_message"))
+        if location:
+            guild["public_message"] = location
+        migrated[str(gid)] = guild
+    return migrated
+
+def _pool_v0_to_v1(raw: dict) -> dict:
+    migrated = {}
+    for gid, payload in raw.items():
+        if not str(gid).isdigit():
+            continue
+        if isinstance(payload, list):
+            payload = {"entries": payload}
+        elif not isinstance(payload, dict):
+            continue
+        entries = payload.get("entries") if isinstance(payload.get("entries"), list) else []
+        guild = {"entries": [[int(item[0]), str(item[1])] for item in entries if isinstance(item, list) and len(item) == 2 and str(item[0]).isdigit()]}
+        location = _storage_location(payload.get("message"))
+        if location:
+            guild["message"] = location
+        migrated[str(gid)] = guild
+    return migrated
+
+def _storage_v1_to_v2(raw: dict) -> dict:
+    return {"schema": 2, "guilds": raw}
+
+def _birthdays_v2_to_v3(raw: dict) -> dict:
+    return {"schema": 3, "guilds": {gid: {**entry, "timezones": {}} for gid, entry in raw["guilds"].items()}}
+
+def _pool_v2_to_v3(raw: dict) -> dict:
+    return {"schema": 3, "guilds": raw["guilds"]}
+
+BIRTHDAY_MIGRATIONS = {0: _birthdays_v0_to_v1, 1: _storage_v1_to_v2, 2: _birthdays_v2_to_v3}
+POOL_MIGRATIONS = {0: _pool_v0_to_v1, 1: _storage_v1_to_v2, 2: _pool_v2_to_v3}
+
+def migrate_storage_document(kind: str, raw: dict, migrations: dict) -> dict:
+    version = raw.get("schema") if isinstance(raw.get("schema"), int) else 0
+    if version > STORAGE_SCHEMA_VERSION:
+        raise ValueError(f"{kind} storage uses schema v{version}, newer than supported v{STORAGE_SCHEMA_VERSION}")
+    if version < STORAGE_SCHEMA_VERSION:
+        storage_migrations.append(f"{kind} v{version}->v{STORAGE_SCHEMA_VERSION}")
+    while version < STORAGE_SCHEMA_VERSION:
+        raw = migrations[version](raw)
+        version += 1
+    return raw
+
+def birthday_models_from_document(doc: dict) -> dict[int, GuildBirthdays]:
+    models = {}
+    for gid, entry in doc["guilds"].items():
+        pm = entry.get("public_message")
+        models[int(gid)] = GuildBirthdays(
+            {int(uid): mm_dd for uid, mm_dd in entry["birthdays"].items()},
+            (pm["channel_id"], pm["message_id"]) if pm else None,
+            {int(uid): tz for uid, tz in entry["timezones"].items()},
+        )
+    return models
+
+def pool_models_from_document(doc: dict) -> dict[int, GuildPool]:
+    models = {}
+    for gid, entry in doc["guilds"].items():
+        message = entry.get("message")
+        models[int(gid)] = GuildPool(
+            [(uid, title) for uid, title in entry["entries"]],
+            (message["channel_id"], message["message_id"]) if message else None,
+        )
+    return models
+
+def build_birthday_document(models: dict[int, GuildBirthdays]) -> dict:
+    guilds = {}
+    for gid, entry in models.items():
+        guild = {"birthdays": {str(uid): mm_dd for uid, mm_dd in entry.birthdays.items()}, "timezones": {str(uid): tz for uid, tz in entry.timezones.items()}}
+        if entry.public_message:
+            guild["public_message"] = {"channel_id": entry.public_message[0], "message_id": entry.public_message[1]}
+        guilds[str(gid)] = guild
+    return {"schema": STORAGE_SCHEMA_VERSION, "guilds": guilds}
+
+async def persist_storage_migrations():
+    if not storage_migrations:
+        return
+    if not (birthday_storage_loaded and pool_storage_loaded):
+        await log_to_thread(f"persist_storage_migrations: deferred ({', '.join(storage_migrations)}); storage did not fully load.")
+        return
+    try:
+        await storage_journal.compact()
+    except Exception as e:
+        await log_exception("persist_storage_migrations", e)
+        return
+    await log_to_thread(f"persist_storage_migrations: rewrote storage snapshots ({', '.join(storage_migrations)}).")
+    storage_migrations.clear()
+
+def _cached_storage_message_ids() -> dict:
+    try:
+        cached = json.loads(storage_backend.get_state("storage_message_ids") or "{}")
+    except ValueError:
+        return {}
+    if not isinstance(cached, dict) or cached.get("channel_id") != BIRTHDAY_STORAGE_CHANNEL_ID:
+        return {}
+    return cached
+
+def remember_storage_message_ids():
+    value = json.dumps({"channel_id": BIRTHDAY_STORAGE_CHANNEL_ID, "birthday": birthday_shards.message_ids, "pool": pool_shards.message_ids, "journal": storage_journal.message_ids})
+    if storage_backend.get_state("storage_message_ids") != value:
+        storage_backend.set_state("storage_message_ids", value)
+
+async def scan_storage_messages(channel, need_birthday: bool, need_pool: bool, need_journal: bool):
+    birthday_legacy_id = None
+    pool_legacy_id = None
+    async for msg in channel.history(limit=STORAGE_SCAN_LIMIT, oldest_first=True):
+        if msg.author != bot.user:
+            continue
+        if need_birthday and birthday_shards.collect(msg):
+            pass
+        elif need_pool and pool_shards.collect(msg):
+            pass
+        elif need_journal and storage_journal.collect(msg):
+            pass
+        elif need_pool and pool_shards.is_legacy(msg.content):
+            pool_legacy_id = msg.id
+        elif need_birthday and birthday_shards.is_legacy(msg.content):
+            birthday_legacy_id = msg.id
+        if not need_journal and (not need_birthday or birthday_shards.is_complete()) and (not need_pool or pool_shards.is_complete()):
+            break
+    if need_birthday:
+        birthday_shards.resolve(birthday_legacy_id)
+    if need_pool:
+        pool_shards.resolve(pool_legacy_id)
+
 async def initialize_storage_message():
-    global storage_message_id, pool_storage_message_id
     channel = bot.get_channel(BIRTHDAY_STORAGE_CHANNEL_ID)
     if not channel:
         await log_to_thread(f"Birthday storage channel not found for BIRTHDAY_STORAGE_CHANNEL_ID={BIRTHDAY_STORAGE_CHANNEL_ID}.")
         return
-    birthday_msg = None
-    pool_msg = None
-    async for msg in channel.history(limit=50, oldest_first=True):
-        if msg.author != bot.user:
-            continue
-        content = (msg.content or "").strip()
-        if content.startswith("POOL_DATA:"):
-            pool_msg = msg
-        else:
-            birthday_msg = msg
-        if birthday_msg and pool_msg:
-            break
-    created_birthday = False
-    created_pool = False
-    if birthday_msg is None:
-        birthday_msg = await channel.send("{}")
-        created_birthday = True
-    if pool_msg is None:
-        pool_msg = await channel.send("POOL_DATA: {}")
-        created_pool = True
-    storage_message_id = birthday_msg.id
-    pool_storage_message_id = pool_msg.id
+    birthday_shards.reset()
+    pool_shards.reset()
+    storage_journal.reset()
+    cached = _cached_storage_message_ids()
+    birthday_cached = await birthday_shards.validate(channel, cached.get("birthday") or [])
+    pool_cached = await pool_shards.validate(channel, cached.get("pool") or [])
+    journal_cached = "journal" in cached and await storage_journal.load(channel, cached.get("journal") or [])
+    if not (birthday_cached and pool_cached and journal_cached):
+        await scan_storage_messages(channel, not birthday_cached, not pool_cached, not journal_cached)
+        if not journal_cached and not await storage_journal.load(channel, storage_journal.resolve()):
+            await log_to_thread("initialize_storage_message: journal messages changed during the scan; starting from the snapshot only.")
+    storage_journal.sync_seq(birthday_shards.seq, pool_shards.seq)
+    created_birthday = not birthday_shards.message_ids
+    created_pool = not pool_shards.message_ids
     if created_birthday:
-        await log_to_thread(f"Initialized birthday storage message id={storage_message_id} in channel {BIRTHDAY_STORAGE_CHANNEL_ID}.")
+        await birthday_shards.save(channel, _encode_birthday_document(build_birthday_document({})))
     if created_pool:
-        await log_to_thread(f"Initialized pool storage message id={pool_storage_message_id} in channel {BIRTHDAY_STORAGE_CHANNEL_ID}.")
+        await pool_shards.save(channel, _encode_pool_document({"schema": STORAGE_SCHEMA_VERSION, "guilds": {}}))
+    remember_storage_message_ids()
+    if created_birthday:
+        await log_to_thread(f"Initialized birthday storage message ids={birthday_shards.message_ids} in channel {BIRTHDAY_STORAGE_CHANNEL_ID}.")
+    if created_pool:
+        await log_to_thread(f"Initialized pool storage message ids={pool_shards.message_ids} in channel {BIRTHDAY_STORAGE_CHANNEL_ID}.")
     if not created_birthday and not created_pool:
-        await log_to_thread(f"Reused existing birthday storage id={storage_message_id} and pool storage id={pool_storage_message_id} in channel {BIRTHDAY_STORAGE_CHANNEL_ID}.")
+        source = "cache" if birthday_cached and pool_cached and journal_cached else "history scan"
+        await log_to_thread(f"Reused existing birthday storage ids={birthday_shards.message_ids}, pool storage ids={pool_shards.message_ids} and {len(storage_journal.message_ids)} journal message(s) in channel {BIRTHDAY_STORAGE_CHANNEL_ID} (resolved from {source}).")
 
-async def _load_storage_message() -> dict:
-    global storage_message_id
+async def _load_storage_message() -> dict[int, GuildBirthdays] | None:
     channel = bot.get_channel(BIRTHDAY_STORAGE_CHANNEL_ID)
-    if not channel or storage_message_id is None:
-        return {}
+    if not channel or not birthday_shards.message_ids:
+        return None
     try:
-        msg = await channel.fetch_message(storage_message_id)
-        data = json.loads(msg.content.strip() or "{}")
-        return data if isinstance(data, dict) else {}
+        doc = migrate_storage_document("birthday", decode_storage_payload(await birthday_shards.load(channel)), BIRTHDAY_MIGRATIONS)
+        return storage_journal.replay(birthday_models_from_document(doc), ("bset", "bdel", "bloc"), birthday_shards.seq, _apply_birthday_record)
     except Exception as e:
         await log_exception("_load_storage_message", e)
-        return {}
+        return None
 
-async def _save_storage_message(data: dict):
-    global storage_message_id
-    channel = bot.get_channel(BIRTHDAY_STORAGE_CHANNEL_ID)
-    if not channel or storage_message_id is None:
-        return
-    try:
-        msg = await channel.fetch_message(storage_message_id)
-        text = json.dumps(data, indent=2)
-        if len(text) > 1900:
-            text = text[:1900]
-        await msg.edit(content=text)
-    except Exception as e:
-        await log_exception("_save_storage_message", e)
+def _encode_birthday_document(data: dict) -> str:
+    return encode_storage_payload(data) if STORAGE_COMPACT_ENCODING else json.dumps(data, indent=2)
+
+def _apply_birthday_record(models: dict[int, GuildBirthdays], record: dict):
+    entry = models.setdefault(record["g"], GuildBirthdays())
+    op = record["op"]
+    if op == "bset":
+        entry.add(record["u"], record["d"], record.get("z"))
+    elif op == "bdel":
+        entry.remove(record["u"])
+    elif op == "bloc":
+        entry.public_message = (record["c"], record["m"])
+
+def journal_birthday_changes(guild_id: int, birthdays: dict[int, tuple[str, str | None] | None], public_location: tuple[int, int] | None) -> list[dict]:
+    records = []
+    for user_id, change in birthdays.items():
+        if change is None:
+            records.append(storage_journal.record("bdel", g=guild_id, u=user_id))
+        else:
+            records.append(storage_journal.record("bset", g=guild_id, u=user_id, d=change[0], z=change[1]))
+    if public_location is not None:
+        records.append(storage_journal.record("bloc", g=guild_id, c=public_location[0], m=public_location[1]))
+    return records
 
-async def _load_pool_message() -> dict:
-    global pool_storage_message_id
+async def _load_pool_message() -> dict[int, GuildPool] | None:
     channel = bot.get_channel(BIRTHDAY_STORAGE_CHANNEL_ID)
-    if not channel or pool_storage_message_id is None:
-        return {}
+    if not channel or not pool_shards.message_ids:
+        return None
     try:
-        msg = await channel.fetch_message(pool_storage_message_id)
-        content = (msg.content or "").strip()
-        if content.startswith("POOL_DATA:"):
-            content = content[len("POOL_DATA:"):].strip()
-        data = json.loads(content or "{}")
-        return data if isinstance(data, dict) else {}
+        doc = migrate_storage_document("pool", decode_storage_payload(await pool_shards.load(channel)), POOL_MIGRATIONS)
+        return storage_journal.replay(pool_models_from_document(doc), ("padd", "prep", "pdel", "ploc"), pool_shards.seq, _apply_pool_record)
     except Exception as e:
         await log_exception("_load_pool_message", e)
-        return {}
+        return None
+
+def _encode_pool_document(data: dict) -> str:
+    return encode_storage_payload(data) if STORAGE_COMPACT_ENCODING else json.dumps(data, separators=(",", ":"))
+
+def _apply_pool_record(models: dict[int, GuildPool], record: dict):
+    pool = models.setdefault(record["g"], GuildPool())
+    op = record["op"]
+    if op == "padd":
+        pool.entries.append((record["u"], record["t"]))
+    elif op == "prep":
+        pool.entries[record["i"]] = (record["u"], record["t"])
+    elif op == "pdel":
+        del pool.entries[record["i"]]
+    elif op == "ploc":
+        pool.message = (record["c"], record["m"])
 
-async def _save_pool_message(data: dict):
-    global pool_storage_message_id
-    channel = bot.get_channel(BIRTHDAY_STORAGE_CHANNEL_ID)
-    if not channel or pool_storage_message_id is None:
-        return
-    try:
-        msg = await channel.fetch_message(pool_storage_message_id)
-        text = "POOL_DATA: " + json.dumps(data, separators=(",", ":"))
-        if len(text) > 1900:
-            text = text[:1900]
-        await msg.edit(content=text)
-    except Exception as e:
-        await log_exception("_save_pool_message", e)
 async def load_request_pool():
-    global request_pool, pool_message_locations
-    raw = await _load_pool_message()
+    global request_pool, pool_message_locations, pool_storage_loaded
+    models = await storage_backend.load_pool()
     request_pool = {}
     pool_message_locations = {}
-    for gid_str, payload in raw.items():
-        try:
-            gid = int(gid_str)
-        except:
-            continue
-        entries = []
-        message_info = None
-        if isinstance(payload, list):
-            entries = payload
-        elif isinstance(payload, dict):
-            if isinstance(payload.get("entries"), list):
-                entries = payload["entries"]
-            message_info = payload.get("message")
-        pool_list = []
-        for item in entries:
-            if isinstance(item, list) and len(item) == 2:
-                uid, title = item
-                try:
-                    uid_int = int(uid)
-                except:
-                    continue
-                pool_list.append((uid_int, str(title)))
-        if pool_list:
-            request_pool[gid] = pool_list
-        if isinstance(message_info, dict):
-            ch_id = message_info.get("channel_id")
-            msg_id = message_info.get("message_id")
-            try:
-                ch_id = int(ch_id)
-                msg_id = int(msg_id)
-            except:
-                continue
-            pool_message_locations[gid] = (ch_id, msg_id)
+    if models is None:
+        pool_storage_loaded = False
+        await log_to_thread("load_request_pool: pool storage could not be loaded; pool changes will not be saved until it loads.")
+        return
+    pool_storage_loaded = True
+    for gid, pool in models.items():
+        if pool.entries:
+            request_pool[gid] = pool.entries
+        if pool.message:
+            pool_message_locations[gid] = pool.message
     await log_to_thread(f"load_request_pool: loaded pools for {len(request_pool)} guild(s); message locations for {len(pool_message_locations)} guild(s).")
 
-async def save_request_pool():
-    raw = {}
+async def save_request_pool(guild_id: int, ops: list[tuple[str, dict]]):
+    if not pool_storage_loaded:
+        await log_to_thread("save_request_pool: skipped; pool storage was never loaded.")
+        return
+    await storage_backend.save_pool(guild_id, ops)
+
+async def add_pool_entry(guild_id: int, user_id: int, title: str):
+    request_pool.setdefault(guild_id, []).append((user_id, title))
+    await save_request_pool(guild_id, [("padd", {"g": guild_id, "u": user_id, "t": title})])
+
+async def replace_pool_entry(guild_id: int, index: int, user_id: int, title: str):
+    request_pool[guild_id][index] = (user_id, title)
+    await save_request_pool(guild_id, [("prep", {"g": guild_id, "i": index, "u": user_id, "t": title})])
+
+async def remove_pool_entries(guild_id: int, indices: list[int]):
+    pool = request_pool.get(guild_id, [])
+    ops = []
+    for index in sorted(set(indices), reverse=True):
+        del pool[index]
+        ops.append(("pdel", {"g": guild_id, "i": index}))
+    await save_request_pool(guild_id, ops)
+
+async def set_pool_public_location(guild_id: int, channel_id: int, message_id: int):
+    pool_message_locations[guild_id] = (channel_id, message_id)
+    await save_request_pool(guild_id, [("ploc", {"g": guild_id, "c": channel_id, "m": message_id})])
+
+def build_pool_document() -> dict:
+    guilds = {}
     all_gids = set(request_pool.keys()) | set(pool_message_locations.keys())
     for gid in all_gids:
         pool = request_pool.get(gid, [])
@@ -483,34 +2199,80 @@ async def save_request_pool():
         if loc:
             ch_id, msg_id = loc
             obj["message"] = {"channel_id": ch_id, "message_id": msg_id}
-        raw[str(gid)] = obj
-    await _save_pool_message(raw)
+        guilds[str(gid)] = obj
+    return {"schema": STORAGE_SCHEMA_VERSION, "guilds": guilds}
 
-async def initialize_media_lists():
-    global movie_titles
-    if gc is None or not SHEET_ID:
+def parse_movie_rows(vals: list[list[str]]) -> list[dict]:
+    movies = []
+    for row in vals:
+        if not row:
+            continue
+        title = row[0].strip() if len(row) > 0 else ""
+        if not title:
+            continue
+        poster = row[1].strip() if len(row) > 1 else ""
+        trailer = row[2].strip() if len(row) > 2 else ""
+        movies.append({"title": title, "poster": poster, "trailer": trailer})
+    return movies
+
+def sheet_values_fingerprint(vals: list[list[str]]) -> str:
+    payload = json.dumps(vals, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return f"{len(vals)}:{zlib.crc32(payload):08x}"
+
+def diff_movie_library(old: list[dict], new: list[dict]) -> tuple[list[str], list[str], list[str]]:
+    before = {m["title"]: m for m in old}
+    after = {m["title"]: m for m in new}
+    added = [t for t in after if t not in before]
+    removed = [t for t in before if t not in after]
+    changed = [t for t in after if t in before and after[t] != before[t]]
+    return added, removed, changed
+
+def apply_movie_library_diff(new: list[dict]) -> list[dict]:
+    reusable: dict[str, list[dict]] = {}
+    for movie in movie_titles:
+        reusable.setdefault(movie["title"], []).append(movie)
+    merged = []
+    for movie in new:
+        candidates = reusable.get(movie["title"])
+        if candidates:
+            current = candidates.pop(0)
+            current.update(movie)
+            merged.append(current)
+        else:
+            merged.append(movie)
+    return merged
+
+async def initialize_media_lists(values: list[list[str]] | None = None) -> bool | None:
+    global movie_titles, movie_library_fingerprint
+    if not sheets.enabled:
         movie_titles = []
+        movie_library_fingerprint = None
         await log_to_thread("initialize_media_lists: QOTD media disabled; missing Google credentials or sheet id.")
-        return
+        return None
     try:
-        sh = gc.open_by_key(SHEET_ID)
-        ws = sh.worksheet("Movies")
-        vals = ws.get_all_values()[1:]
-        movies = []
-        for row in vals:
-            if not row:
-                continue
-            title = row[0].strip() if len(row) > 0 else ""
-            if not title:
-                continue
-            poster = row[1].strip() if len(row) > 1 else ""
-            trailer = row[2].strip() if len(row) > 2 else ""
-            movies.append({"title": title, "poster": poster, "trailer": trailer})
-        movie_titles = movies
-        await log_to_thread(f"initialize_media_lists: loaded {len(movie_titles)} movies from sheet.")
+        if values is None:
+            values = await sheets.values(await sheets.worksheet("Movies"))
+        vals = values[1:]
+        fingerprint = sheet_values_fingerprint(vals)
+        if fingerprint == movie_library_fingerprint:
+            await log_to_thread(f"initialize_media_lists: Movies sheet unchanged ({len(movie_titles)} movies, fingerprint {fingerprint}).")
+            return False
+        movies = parse_movie_rows(vals)
+        added, removed, changed = diff_movie_library(movie_titles, movies)
+        movie_titles = apply_movie_library_diff(movies)
+        movie_library_fingerprint = fingerprint
+        lines = [f"initialize_media_lists: loaded {len(movie_titles)} movies from sheet (+{len(added)} -{len(removed)} ~{len(changed)})."]
+        for label, titles in (("added", added), ("removed", removed), ("changed", changed)):
+            if titles:
+                lines.append(f"{label}: " + ", ".join(titles[:25]) + (f" (+{len(titles) - 25} more)" if len(titles) > 25 else ""))
+        await log_to_thread("\n".join(lines))
+        return True
     except Exception as e:
         movie_titles = []
+        movie_library_fingerprint = None
+        sheets.forget()
         await log_exception("initialize_media_lists", e)
+        return None
 
 async def sync_movie_library_messages():
     if MOVIE_STORAGE_CHANNEL_ID == 0:
@@ -532,6 +2294,8 @@ async def sync_movie_library_messages():
         content = f"{title}\n{trailer}" if trailer else title
         if idx < len(existing):
             m = existing[idx]
+            if m.content == content and m.components:
+                continue
             try:
                 await m.edit(content=content, view=MovieEntryView())
                 edited += 1
@@ -555,68 +2319,268 @@ async def sync_movie_library_messages():
             await log_exception("sync_movie_library_messages_delete", e)
     await log_to_thread(f"sync_movie_library_messages: edited={edited}, created={created}, deleted={deleted} in channel {MOVIE_STORAGE_CHANNEL_ID}.")
 
-async def set_birthday(guild_id: int, user_id: int, mm_dd: str):
-    data = await _load_storage_message()
-    gid = str(guild_id)
-    entry = data.get(gid)
-    if entry is None:
-        entry = {"birthdays": {}}
-    elif not (isinstance(entry, dict) and isinstance(entry.get("birthdays"), dict)):
-        entry = {"birthdays": entry if isinstance(entry, dict) else {}}
-    entry["birthdays"][str(user_id)] = mm_dd
-    data[gid] = entry
-    await _save_storage_message(data)
-
-async def get_guild_birthdays(guild_id: int):
-    data = await _load_storage_message()
-    entry = data.get(str(guild_id), {})
-    if isinstance(entry, dict) and isinstance(entry.get("birthdays"), dict):
-        return entry["birthdays"]
-    return entry if isinstance(entry, dict) else {}
-
-async def build_birthday_embed(guild: discord.Guild) -> discord.Embed:
-    birthdays = await get_guild_birthdays(guild.id)
+async def load_birthday_storage() -> bool:
+    global birthday_data, birthday_storage_loaded
+    data = await storage_backend.load_birthdays()
+    if data is None:
+        birthday_storage_loaded = False
+        await log_to_thread("load_birthday_storage: birthday storage could not be loaded; writes are disabled until it loads.")
+        return False
+    birthday_data = data
+    birthday_storage_loaded = True
+    birthday_embeds.invalidate()
+    await log_to_thread(f"load_birthday_storage: cached birthdays for {len(birthday_data)} guild(s).")
+    schedule_birthday_roles()
+    return True
+
+def schedule_birthday_roles():
+    now = datetime.now(timezone.utc)
+    window = [(now + timedelta(days=offset)).strftime("%m-%d") for offset in (-1, 0, 1)]
+    for guild_id, entry in birthday_data.items():
+        current = set().union(*(entry.on(mm_dd) for mm_dd in window))
+        for user_id, mm_dd in entry.birthdays.items():
+            next_at = now if user_id in current else birthday_transition(mm_dd, entry.timezones.get(user_id), now)[1]
+            if next_at:
+                birthday_roles.schedule(guild_id, user_id, next_at)
+    for guild in bot.guilds:
+        role = guild.get_role(BIRTHDAY_ROLE_ID)
+        for member in role.members if role else []:
+            birthday_roles.schedule(guild.id, member.id, now)
+
+async def apply_birthday_role(guild_id: int, user_id: int, now: datetime):
+    entry = birthday_data.get(guild_id)
+    mm_dd = entry.birthdays.get(user_id) if entry else None
+    active = False
+    next_at = None
+    if mm_dd:
+        active, next_at = birthday_transition(mm_dd, entry.timezones.get(user_id), now)
+        if next_at:
+            birthday_roles.schedule(guild_id, user_id, next_at)
+    guild = bot.get_guild(guild_id)
+    role = guild.get_role(BIRTHDAY_ROLE_ID) if guild else None
+    member = guild.get_member(user_id) if guild else None
+    if not role or not member:
+        return
+    has_role = member.get_role(role.id) is not None
+    if active == has_role:
+        return
+    try:
+        if active:
+            await member.add_roles(role, reason="Birthday!")
+        else:
+            await member.remove_roles(role, reason="Birthday over")
+    except (Exception, asyncio.CancelledError):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=BIRTHDAY_ROLE_RETRY_SECONDS)
+        birthday_roles.schedule(guild_id, user_id, min(retry_at, next_at) if next_at else retry_at)
+        raise
+    birthday_roles.transitions += 1
+    await log_to_thread(f"birthday_checker guild={guild_id} user={user_id} {'granted' if active else 'revoked'} birthday role.")
+
+async def ensure_birthday_storage() -> bool:
+    if birthday_storage_loaded:
+        return True
+    return await load_birthday_storage()
+
+async def set_birthday(guild_id: int, user_id: int, mm_dd: str, tz: str | None = None) -> bool:
+    if not await ensure_birthday_storage():
+        return False
+    try:
+        return await birthday_transactions.run(guild_id, lambda txn: txn.set(user_id, mm_dd, tz))
+    except Exception as e:
+        await log_exception("set_birthday", e)
+        return False
+
+async def remove_birthday(guild_id: int, user_id: int) -> bool:
+    if not await ensure_birthday_storage():
+        return False
+    if user_id not in get_guild_birthdays(guild_id):
+        return False
+    try:
+        return await birthday_transactions.run(guild_id, lambda txn: txn.remove(user_id))
+    except Exception as e:
+        await log_exception("remove_birthday", e)
+        return False
+
+def get_guild_birthdays(guild_id: int) -> dict[int, str]:
+    entry = birthday_data.get(guild_id)
+    return entry.birthdays if entry else {}
+
+def _import_birthday_row(label: str, user_id, mm_dd, tz, birthdays: dict, errors: list):
+    user_id = str(user_id or "").strip().strip("<@!>")
+    if not user_id.isdigit():
+        errors.append(f"{label}: invalid user id {user_id!r}")
+        return
+    try:
+        month, day = (int(part) for part in str(mm_dd or "").strip().split("-"))
+        date(2000, month, day)
+    except ValueError:
+        errors.append(f"{label}: invalid date {mm_dd!r} (expected MM-DD)")
+        return
+    tz = str(tz or "").strip() or None
+    if tz and not is_valid_timezone(tz):
+        errors.append(f"{label}: unknown timezone {tz!r}")
+        return
+    birthdays[int(user_id)] = (f"{month:02d}-{day:02d}", tz)
+
+def parse_birthday_import(filename: str, raw: bytes) -> tuple[dict[int, tuple[str, str | None]], list[str]]:
+    text = raw.decode("utf-8-sig")
+    birthdays: dict[int, tuple[str, str | None]] = {}
+    errors: list[str] = []
+    if filename.lower().endswith(".json") or text.lstrip().startswith(("{", "[")):
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = [{"user_id": user_id, "date": mm_dd} for user_id, mm_dd in data.items()]
+        if not isinstance(data, list):
+            raise ValueError("JSON must be a list of {user_id, date, timezone} objects or a {user_id: date} map")
+        for number, item in enumerate(data, start=1):
+            if not isinstance(item, dict):
+                errors.append(f"item {number}: expected an object")
+                continue
+            _import_birthday_row(f"item {number}", item.get("user_id"), item.get("date"), item.get("timezone"), birthdays, errors)
+    else:
+        for number, row in enumerate(csv.reader(io.StringIO(text)), start=1):
+            if not "".join(row).strip():
+                continue
+            if number == 1 and row[0].strip().lower() == "user_id":
+                continue
+            _import_birthday_row(f"line {number}", row[0], row[1] if len(row) > 1 else None, row[2] if len(row) > 2 else None, birthdays, errors)
+    return birthdays, errors
+
+def export_birthdays(guild_id: int, fmt: str) -> str:
+    entry = birthday_data.get(guild_id)
+    rows = sorted(entry.birthdays.items(), key=lambda x: x[1]) if entry else []
+    if fmt == "json":
+        return json.dumps([{"user_id": str(user_id), "date": mm_dd, "timezone": entry.timezones.get(user_id)} for user_id, mm_dd in rows], indent=2)
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["user_id", "date", "timezone"])
+    for user_id, mm_dd in rows:
+        writer.writerow([user_id, mm_dd, entry.timezones.get(user_id, "")])
+    return out.getvalue()
+
+async def import_birthdays(guild_id: int, birthdays: dict[int, tuple[str, str | None]]) -> bool:
+    if not await ensure_birthday_storage():
+        return False
+    def apply(txn):
+        for user_id, (mm_dd, tz) in birthdays.items():
+            txn.set(user_id, mm_dd, tz or txn.entry.timezones.get(user_id))
+        return True
+    try:
+        return await birthday_transactions.run(guild_id, apply)
+    except Exception as e:
+        await log_exception("import_birthdays", e)
+        return False
+
+def upcoming_birthdays(guild_id: int, today: date, days: int) -> list[tuple[str, int]]:
+    entry = birthday_data.get(guild_id)
+    if not entry or days < 0:
+        return []
+    start = today.strftime("%m-%d")
+    if days >= 365:
+        return entry.between(start, start)
+    return entry.between(start, (today + timedelta(days=days + 1)).strftime("%m-%d"))
+
+def days_until_birthday(mm_dd: str, today: date) -> int:
+    month, day = (int(part) for part in mm_dd.split("-"))
+    for year in (today.year, today.year + 1):
+        try:
+            upcoming = date(year, month, day)
+        except ValueError:
+            upcoming = date(year, 2, 28)
+        if upcoming >= today:
+            return (upcoming - today).days
+    return 0
+
+def get_birthday_timezone(guild_id: int, user_id: int) -> str | None:
+    entry = birthday_data.get(guild_id)
+    return entry.timezones.get(user_id) if entry else None
+
+BIRTHDAY_SHARE_TEXT = "\n\n**SHARE YOUR BIRTHDAY**\n• </set:1440919374310408234> - Add your birthday to the server’s shared birthday list."
+BIRTHDAY_LIST_FOOTER = "Messages in this channel are deleted after 5 minutes"
+
+def birthday_list_lines(guild: discord.Guild) -> list[str]:
     lines = []
-    for user_id, mm_dd in sorted(birthdays.items(), key=lambda x: x[1]):
-        member = guild.get_member(int(user_id))
+    entry = birthday_data.get(guild.id)
+    for mm_dd, user_id in entry.calendar if entry else []:
+        member = guild.get_member(user_id)
         if member:
             lines.append(f"{member.mention} — `{mm_dd}`")
         else:
             lines.append(f"<@{user_id}> — `{mm_dd}`")
-    description = "\n".join(lines) if lines else "No birthdays yet!"
-    description += "\n\n**SHARE YOUR BIRTHDAY**\n• </set:1440919374310408234> - Add your birthday to the server’s shared birthday list."
-    return discord.Embed(
-        title="OUR BIRTHDAYS!",
-        description=description,
+    return lines
+
+def paginate_lines(lines: list[str], budget: int) -> list[str]:
+    descriptions = []
+    current = ""
+    for line in lines:
+        if current and len(current) + 1 + len(line) > budget:
+            descriptions.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+    descriptions.append(current)
+    return descriptions
+
+def birthday_list_embed(description: str, index: int, total: int, last: bool) -> discord.Embed:
+    embed = discord.Embed(
+        title="OUR BIRTHDAYS!" if total == 1 else f"OUR BIRTHDAYS! ({index}/{total})",
+        description=description + (BIRTHDAY_SHARE_TEXT if last else ""),
         color=0x2e2f33
-    ).set_footer(text="Messages in this channel are deleted after 5 minutes")
-
-async def get_birthday_public_location(guild_id: int):
-    data = await _load_storage_message()
-    entry = data.get(str(guild_id))
-    if isinstance(entry, dict):
-        pm = entry.get("public_message")
-        if isinstance(pm, dict):
-            ch_id = pm.get("channel_id")
-            msg_id = pm.get("message_id")
-            if isinstance(ch_id, int) and isinstance(msg_id, int):
-                return ch_id, msg_id
-    return None
-
-async def set_birthday_public_location(guild_id: int, channel_id: int, message_id: int):
-    data = await _load_storage_message()
-    gid = str(guild_id)
-    entry = data.get(gid)
-    if entry is None:
-        entry = {"birthdays": {}}
-    elif not (isinstance(entry, dict) and isinstance(entry.get("birthdays"), dict)):
-        entry = {"birthdays": entry if isinstance(entry, dict) else {}}
-    entry["public_message"] = {"channel_id": channel_id, "message_id": message_id}
-    data[gid] = entry
-    await _save_storage_message(data)
+    )
+    if last:
+        embed.set_footer(text=BIRTHDAY_LIST_FOOTER)
+    return embed
+
+def render_birthday_embeds(guild: discord.Guild) -> list[discord.Embed]:
+    descriptions = paginate_lines(birthday_list_lines(guild) or ["No birthdays yet!"], EMBED_DESCRIPTION_LIMIT - len(BIRTHDAY_SHARE_TEXT))
+    total = len(descriptions)
+    return [birthday_list_embed(description, index, total, True) for index, description in enumerate(descriptions, start=1)]
+
+async def build_birthday_embeds(guild: discord.Guild) -> list[discord.Embed]:
+    pages = birthday_embeds.get(guild.id)
+    if pages is None:
+        pages = render_birthday_embeds(guild)
+        birthday_embeds.put(guild.id, pages)
+    return pages
+
+def public_birthday_embeds(guild: discord.Guild) -> list[discord.Embed]:
+    lines = birthday_list_lines(guild) or ["No birthdays yet!"]
+    title_reserve = MESSAGE_EMBEDS_LIMIT * len(f"OUR BIRTHDAYS! ({MESSAGE_EMBEDS_LIMIT}/{MESSAGE_EMBEDS_LIMIT})")
+    budget = MESSAGE_EMBEDS_CHAR_LIMIT - len(BIRTHDAY_SHARE_TEXT) - len(BIRTHDAY_LIST_FOOTER) - title_reserve
+    overflow = "\n…and {} more; use /birthdays to see the full list."
+    shown = []
+    used = 0
+    for index, line in enumerate(lines):
+        cost = len(line) + 1
+        remaining = len(lines) - index - 1
+        reserve = len(overflow.format(len(lines))) if remaining else 0
+        if used + cost + reserve > budget:
+            break
+        shown.append(line)
+        used += cost
+    descriptions = paginate_lines(shown, EMBED_DESCRIPTION_LIMIT - len(BIRTHDAY_SHARE_TEXT) - len(overflow.format(len(lines))))
+    if len(shown) < len(lines):
+        descriptions[-1] += overflow.format(len(lines) - len(shown))
+    descriptions = descriptions[:MESSAGE_EMBEDS_LIMIT]
+    total = len(descriptions)
+    return [birthday_list_embed(description, index, total, index == total) for index, description in enumerate(descriptions, start=1)]
+
+def get_birthday_public_location(guild_id: int) -> tuple[int, int] | None:
+    entry = birthday_data.get(guild_id)
+    return entry.public_message if entry else None
+
+async def set_birthday_public_location(guild_id: int, channel_id: int, message_id: int, expected_version: int | None = None) -> bool:
+    if not await ensure_birthday_storage():
+        return False
+    try:
+        return await birthday_transactions.run(guild_id, lambda txn: txn.set_public_location(channel_id, message_id), expected_version)
+    except BirthdayConflict:
+        raise
+    except Exception as e:
+        await log_exception("set_birthday_public_location", e)
+        return False
 
 async def update_birthday_list_message(guild: discord.Guild):
-    loc = await get_birthday_public_location(guild.id)
+    loc = get_birthday_public_location(guild.id)
     if not loc:
         return
     ch_id, msg_id = loc
@@ -624,10 +2588,10 @@ async def update_birthday_list_message(guild: discord.Guild):
     if not channel:
         return
     try:
-        msg = await channel.fetch_message(msg_id)
-        embed = await build_birthday_embed(guild)
-        await msg.edit(embed=embed, allowed_mentions=discord.AllowedMentions(users=True))
-    except:
+        embeds = public_birthday_embeds(guild)
+        if not await edit_message_by_id(channel, msg_id, embeds=embeds, allowed_mentions=discord.AllowedMentions(users=True)):
+            await log_to_thread(f"update_birthday_list_message: public message {msg_id} in guild {guild.id} no longer exists; run /birthdays_public to recreate it.")
+    except discord.HTTPException:
         pass
 
 async def build_pool_embed(guild: discord.Guild) -> discord.Embed:
@@ -670,65 +2634,238 @@ async def update_pool_public_message(guild: discord.Guild):
     if not channel:
         return
     try:
-        msg = await channel.fetch_message(msg_id)
         embed = await build_pool_embed(guild)
-        await msg.edit(embed=embed)
-    except:
+        if not await edit_message_by_id(channel, msg_id, embed=embed):
+            await log_to_thread(f"update_pool_public_message: public message {msg_id} in guild {guild.id} no longer exists; run /pool_public to recreate it.")
+    except discord.HTTPException:
         pass
 
-async def get_qotd_sheet_and_tab():
-    if gc is None or not SHEET_ID:
+def qotd_tab_for(day: date) -> str:
+    return "Fall Season" if 10 <= day.month <= 11 else "Christmas" if day.month == 12 else "Regular"
+
+async def get_qotd_sheet_and_tab(tab: str):
+    if not sheets.enabled:
         raise RuntimeError("QOTD is not configured.")
-    sh = gc.open_by_key(SHEET_ID)
-    today = datetime.utcnow()
-    tab = "Fall Season" if 10 <= today.month <= 11 else "Christmas" if today.month == 12 else "Regular"
     try:
-        ws = sh.worksheet(tab)
+        ws = await sheets.worksheet(tab)
     except gspread.WorksheetNotFound:
-        ws = sh.sheet1
-        tab = ws.title
-        await log_to_thread(f"QOTD: worksheet '{tab}' not found, using first sheet.")
-    return ws, tab
+        ws = await sheets.first_worksheet()
+        await log_to_thread(f"QOTD: worksheet '{tab}' not found, using first sheet '{ws.title}'.")
+    return ws, ws.title
+
+async def flush_qotd_bank(bank: QotdBank) -> bool:
+    if not bank.pending:
+        return True
+    batch = dict(bank.pending)
+    try:
+        if bank.worksheet is None:
+            bank.worksheet = await sheets.worksheet(bank.tab)
+        await sheets.batch_update(bank.worksheet, [{"range": cell, "values": [[value]]} for cell, value in batch.items()])
+    except Exception as e:
+        await log_exception(f"qotd_flush_{bank.tab}", e)
+        return False
+    for cell, value in batch.items():
+        if bank.pending.get(cell) == value:
+            del bank.pending[cell]
+    bank.fingerprint = sheet_values_fingerprint(bank.values)
+    return True
+
+async def load_qotd_bank(tab: str, force: bool = False) -> QotdBank:
+    bank = qotd_banks.setdefault(tab, QotdBank(tab))
+    now = datetime.now(timezone.utc)
+    if not force and bank.refreshed_at and (now - bank.refreshed_at).total_seconds() < QOTD_BANK_REFRESH_SECONDS:
+        return bank
+    if not await flush_qotd_bank(bank) and bank.refreshed_at:
+        return bank
+    try:
+        worksheet = bank.worksheet or (await get_qotd_sheet_and_tab(tab))[0]
+        values = await sheets.values(worksheet)
+    except Exception as e:
+        bank.worksheet = None
+        sheets.forget()
+        if bank.refreshed_at is None:
+            raise
+        await log_exception(f"qotd_bank_refresh_{tab}", e)
+        return bank
+    return await prime_qotd_bank(tab, worksheet, values)
+
+async def prime_qotd_bank(tab: str, worksheet, values: list[list[str]]) -> QotdBank:
+    bank = qotd_banks.setdefault(tab, QotdBank(tab))
+    bank.refreshed_at = datetime.now(timezone.utc)
+    fingerprint = sheet_values_fingerprint(values)
+    if fingerprint != bank.fingerprint:
+        bank.load(worksheet, values, fingerprint)
+        await log_to_thread(f"QOTD: loaded {len(bank.questions)} question(s) from '{bank.title}' ({len(bank.unused)} unused).")
+    return bank
+
+async def initialize_sheet_snapshot():
+    if not sheets.enabled:
+        await initialize_media_lists()
+        return
+    try:
+        snapshot = await sheets.snapshot(["Movies", *QOTD_TABS])
+    except Exception as e:
+        await log_exception("initialize_sheet_snapshot", e)
+        await initialize_media_lists()
+        return
+    await log_to_thread(f"initialize_sheet_snapshot: fetched {', '.join(snapshot) or 'no worksheets'} in one batch.")
+    await initialize_media_lists(snapshot.get("Movies"))
+    for tab in QOTD_TABS:
+        if tab in snapshot:
+            await prime_qotd_bank(tab, None, snapshot[tab])
+
+def build_qotd_embed(text: str, season: str) -> discord.Embed:
+    colors = {"Regular": 0x9b59b6, "Fall Season": 0xe67e22, "Christmas": 0x00ff00}
+    embed = discord.Embed(title="Question of the Day", description=text, color=colors.get(season, 0x9b59b6))
+    embed.set_footer(text=f"{season} • Reply below!")
+    return embed
+
+def next_qotd_date(now: datetime) -> date:
+    return DailySchedule(QOTD_POST_HOUR, 0).next(now).date()
+
+def staged_qotd_text(entry: dict) -> str | None:
+    return entry.get("text") or entry.get("embed", {}).get("description")
+
+async def stage_qotd(target: int = QOTD_STAGE_QUEUE_SIZE) -> int:
+    async with qotd_staging.lock:
+        return await refill_qotd_staging(target)
+
+async def refill_qotd_staging(target: int) -> int:
+    if not sheets.enabled:
+        raise RuntimeError("QOTD is not configured.")
+    tab = qotd_tab_for(next_qotd_date(datetime.now(timezone.utc)))
+    queue = qotd_staging.entries()
+    for entry in [e for e in queue if e.get("tab") != tab]:
+        stale = await load_qotd_bank(entry["tab"])
+        question = stale.find(entry.get("row"), staged_qotd_text(entry))
+        if question:
+            stale.restore(question)
+        await flush_qotd_bank(stale)
+    queue = [e for e in queue if e.get("tab") == tab]
+    bank = await load_qotd_bank(tab)
+    status = f"Reserved {datetime.utcnow():%Y-%m-%d}"
+    reserved = set()
+    for entry in queue:
+        question = bank.find(entry.get("row"), staged_qotd_text(entry))
+        if question is None:
+            continue
+        entry["row"] = question.row
+        reserved.add(question.row)
+        if not question.used:
+            bank.mark(question.row, status)
+    staged = 0
+    while len(queue) < target and bank.questions:
+        question = bank.draw(status)
+        if question is None:
+            cleared = bank.reset(keep=reserved)
+            await log_to_thread(f"QOTD: All questions used; resetting {cleared} status cell(s).")
+            question = bank.draw(status)
+            if question is None:
+                break
+        season = bank.title
+        queue.append({"tab": tab, "row": question.row, "text": question.text, "season": season, "embed": build_qotd_embed(question.text, season).to_dict(), "staged": datetime.now(timezone.utc).isoformat()})
+        reserved.add(question.row)
+        staged += 1
+    await flush_qotd_bank(bank)
+    qotd_staging.replace(queue)
+    if staged:
+        await log_to_thread(f"QOTD: staged {staged} question(s) from '{bank.title}'; {len(queue)} ready.")
+    return staged
 
 async def post_daily_qotd():
-    if gc is None or not SHEET_ID or QOTD_CHANNEL_ID == 0:
+    if QOTD_CHANNEL_ID == 0:
         await log_to_thread("QOTD: post_daily_qotd skipped; configuration incomplete.")
         return
     channel = bot.get_channel(QOTD_CHANNEL_ID)
     if not channel:
         await log_to_thread("QOTD: post_daily_qotd skipped; QOTD channel not found.")
         return
-    worksheet, season = await get_qotd_sheet_and_tab()
-    all_vals = worksheet.get_all_values()
-    if len(all_vals) < 2:
-        await log_to_thread("QOTD: Sheet has no questions (rows < 2).")
-        return
-    questions = all_vals[1:]
-    unused = []
-    for row in questions:
-        row += [""] * (2 - len(row))
-        status_a, status_b = row[0].strip(), row[1].strip() if len(row) > 1 else ""
-        question_text = row[1].strip() if len(row) > 1 else row[0].strip()
-        if question_text and (not status_a or not status_b):
-            unused.append(row)
-    if not unused:
-        await log_to_thread("QOTD: All questions used; resetting.")
-        worksheet.update("A2:B", [[""] * 2 for _ in range(len(questions))])
-        unused = questions
-    chosen = pyrandom.choice(unused)
-    chosen += [""] * (2 - len(chosen))
-    question = chosen[1].strip() or chosen[0].strip()
-    if not question:
-        await log_to_thread("QOTD: Selected row had no question text; skipping.")
-        return
-    colors = {"Regular": 0x9b59b6, "Fall Season": 0xe67e22, "Christmas": 0x00ff00}
-    embed = discord.Embed(title="Question of the Day", description=question, color=colors.get(season, 0x9b59b6))
-    embed.set_footer(text=f"{season} • Reply below!")
-    await channel.send(embed=embed)
-    row_idx = questions.index(chosen) + 2
-    status_col = "A" if chosen[1].strip() else "B"
-    worksheet.update(f"{status_col}{row_idx}", [[f"Used {datetime.utcnow().strftime('%Y-%m-%d')}"]])
-    await log_to_thread(f"QOTD: Posted question from row {row_idx} ({season}).")
+    tab = qotd_tab_for(datetime.utcnow().date())
+    async with qotd_staging.lock:
+        if not qotd_staging.entries():
+            if not sheets.enabled:
+                await log_to_thread("QOTD: post_daily_qotd skipped; nothing staged and Google Sheets is not configured.")
+                return
+            await log_to_thread("QOTD: nothing staged; preparing a question now.")
+            await refill_qotd_staging(1)
+        entry = qotd_staging.take(tab)
+        if entry is None:
+            await log_to_thread("QOTD: Sheet has no questions.")
+            return
+        try:
+            await channel.send(embed=discord.Embed.from_dict(entry["embed"]))
+        except Exception:
+            qotd_staging.put_back(entry)
+            raise
+        bank = qotd_banks.get(entry["tab"])
+        question = bank.find(entry.get("row"), staged_qotd_text(entry)) if bank else None
+        if question:
+            bank.mark(question.row, f"Used {datetime.utcnow():%Y-%m-%d}")
+    await log_to_thread(f"QOTD: Posted question from row {entry['row']} ({entry['season']}, staged {entry.get('staged', '?')[:16]}).")
+
+async def run_daily_job(job: str, scope: str, slot: datetime, now: datetime, run) -> JobOutcome:
+    try:
+        result = await run()
+    except asyncio.CancelledError:
+        job_ledger.failed(job, scope, datetime.now(timezone.utc))
+        raise
+    except Exception as e:
+        job_ledger.failed(job, scope, datetime.now(timezone.utc))
+        await log_exception(f"{job}_{scope}", e)
+        return JobOutcome(errors=1)
+    job_ledger.record(job, scope, slot)
+    if now - slot > timedelta(minutes=5):
+        await log_to_thread(f"{job} scope={scope}: caught up the run missed at {slot:%Y-%m-%d %H:%M} UTC.")
+    return result if isinstance(result, JobOutcome) else JobOutcome(items=1)
+
+def percentile(values, pct: float) -> float | None:
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+async def run_member_ops(label: str, ops: list[tuple[str, object]]) -> tuple[int, int]:
+    semaphore = asyncio.Semaphore(MEMBER_OP_CONCURRENCY)
+
+    async def run(description: str, op) -> bool:
+        async with semaphore:
+            try:
+                await op()
+            except Exception as e:
+                await log_to_thread(f"{label}: {description} failed: {e!r}")
+                return False
+            return True
+
+    results = await asyncio.gather(*(run(description, op) for description, op in ops))
+    done = sum(results)
+    return done, len(results) - done
+
+async def fan_out_guilds(job: str, guild_ids: list[int], work) -> JobOutcome:
+    if not guild_ids:
+        return JobOutcome()
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(GUILD_FANOUT_CONCURRENCY)
+
+    async def run(guild_id: int) -> tuple[int, float, JobOutcome]:
+        async with semaphore:
+            started = loop.time()
+            try:
+                outcome = await work(guild_id) or JobOutcome()
+            except Exception as e:
+                outcome = JobOutcome(errors=1)
+                await log_exception(f"{job}_guild_{guild_id}", e)
+            return guild_id, loop.time() - started, outcome
+
+    started = loop.time()
+    stats = await asyncio.gather(*(run(guild_id) for guild_id in guild_ids))
+    elapsed = loop.time() - started
+    total = sum((outcome for _, _, outcome in stats), JobOutcome())
+    lines = [f"{job}: {len(stats)} guild(s), {total.items} item(s), {total.errors} error(s) in {elapsed:.2f}s (concurrency={GUILD_FANOUT_CONCURRENCY})"]
+    for guild_id, wall, outcome in stats:
+        rate = outcome.items / wall if wall > 0 else 0.0
+        lines.append(f"guild={guild_id} wall={wall:.2f}s items={outcome.items} errors={outcome.errors} rate={rate:.1f}/s")
+    await log_to_thread("\n".join(lines))
+    return total
 
 def find_role_by_name(guild: discord.Guild, name: str) -> discord.Role | None:
     name_lower = name.lower()
@@ -741,55 +2878,47 @@ def find_role_by_name(guild: discord.Guild, name: str) -> discord.Role | None:
 async def apply_theme_for_today(guild: discord.Guild, today: str | None = None):
     if today is None:
         today = datetime.utcnow().strftime("%m-%d")
-    removed_roles = await clear_theme_roles(guild)
+    removed_roles, failed_roles = await clear_theme_roles(guild)
     removed_emojis = await clear_theme_emojis(guild)
     added_roles = 0
     added_emojis = 0
     mode = "none"
     if "10-01" <= today <= "10-31":
-        added_roles = await apply_theme_roles(guild, "halloween")
-        added_emojis = await apply_theme_emojis(guild, "halloween")
         mode = "halloween"
     elif "12-01" <= today <= "12-26":
-        added_roles = await apply_theme_roles(guild, "christmas")
-        added_emojis = await apply_theme_emojis(guild, "christmas")
         mode = "christmas"
-    await log_to_thread(f"theme_update guild={guild.id} today={today} mode={mode} roles_cleared={removed_roles} emojis_cleared={removed_emojis} roles_added={added_roles} emojis_added={added_emojis}")
-    return mode, removed_roles, removed_emojis, added_roles, added_emojis
-
-async def apply_theme_roles(guild: discord.Guild, theme: str) -> int:
+    if mode != "none":
+        added_roles, failed_adds = await apply_theme_roles(guild, mode)
+        failed_roles += failed_adds
+        added_emojis = await apply_theme_emojis(guild, mode)
+    await log_to_thread(f"theme_update guild={guild.id} today={today} mode={mode} roles_cleared={removed_roles} emojis_cleared={removed_emojis} roles_added={added_roles} emojis_added={added_emojis} role_failures={failed_roles}")
+    return mode, removed_roles, removed_emojis, added_roles, added_emojis, failed_roles
+
+async def apply_theme_roles(guild: discord.Guild, theme: str) -> tuple[int, int]:
     role_map = THEME_CHRISTMAS_ROLES if theme == "christmas" else THEME_HALLOWEEN_ROLES
-    added = 0
-    for color_name, base_keyword in role_map.items():
-        color_role = find_role_by_name(guild, color_name)
-        if not color_role:
-            continue
+    targets = [(role, keyword) for name, keyword in role_map.items() if (role := find_role_by_name(guild, name))]
+    ops = []
+    if targets:
         async for member in guild.fetch_members(limit=None):
-            if any(base_keyword.lower() in r.name.lower() for r in member.roles):
-                if color_role not in member.roles:
-                    try:
-                        await member.add_roles(color_role, reason=f"{theme.capitalize()} theme")
-                        added += 1
-                    except:
-                        pass
+            for color_role, base_keyword in targets:
+                if color_role not in member.roles and any(base_keyword.lower() in r.name.lower() for r in member.roles):
+                    ops.append((f"add {color_role.name} to {member.id}", lambda member=member, role=color_role: member.add_roles(role, reason=f"{theme.capitalize()} theme")))
+    added, failed = await run_member_ops(f"theme_roles guild={guild.id}", ops)
     icon_url = ICON_CHRISTMAS_URL if theme == "christmas" else ICON_HALLOWEEN_URL
     await apply_icon_to_bot_and_server(guild, icon_url)
-    return added
+    return added, failed
 
-async def clear_theme_roles(guild: discord.Guild) -> int:
-    removed = 0
-    for color_name in {**THEME_CHRISTMAS_ROLES, **THEME_HALLOWEEN_ROLES}:
-        role = find_role_by_name(guild, color_name)
-        if role:
-            async for member in guild.fetch_members(limit=None):
+async def clear_theme_roles(guild: discord.Guild) -> tuple[int, int]:
+    roles = [role for name in {**THEME_CHRISTMAS_ROLES, **THEME_HALLOWEEN_ROLES} if (role := find_role_by_name(guild, name))]
+    ops = []
+    if roles:
+        async for member in guild.fetch_members(limit=None):
+            for role in roles:
                 if role in member.roles:
-                    try:
-                        await member.remove_roles(role, reason="Theme ended")
-                        removed += 1
-                    except:
-                        pass
+                    ops.append((f"remove {role.name} from {member.id}", lambda member=member, role=role: member.remove_roles(role, reason="Theme ended")))
+    removed, failed = await run_member_ops(f"theme_roles guild={guild.id}", ops)
     await apply_icon_to_bot_and_server(guild, ICON_DEFAULT_URL)
-    return removed
+    return removed, failed
 
 async def apply_icon_to_bot_and_server(guild: discord.Guild, url: str):
     if not url:
@@ -1016,8 +3145,7 @@ class MediaPagerView(discord.ui.View):
                 ephemeral=True,
             )
 
-        pool.append((user.id, movie_title))
-        await save_request_pool()
+        await add_pool_entry(guild.id, user.id, movie_title)
         await update_pool_public_message(guild)
 
         await interaction.response.send_message(
@@ -1037,6 +3165,22 @@ class MediaPagerView(discord.ui.View):
         self._refresh_dropdown()
         await interaction.response.edit_message(content=self._build_content(), view=self)
 
+class BirthdayPagerView(discord.ui.View):
+    def __init__(self, pages: list[discord.Embed], page: int = 0):
+        super().__init__(timeout=120)
+        self.pages = pages
+        self.page = page
+
+    @discord.ui.button(label="Prev", style=discord.ButtonStyle.secondary)
+    async def prev(self, button, interaction):
+        self.page = (self.page - 1) % len(self.pages)
+        await interaction.response.edit_message(embed=self.pages[self.page], view=self)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
+    async def next(self, button, interaction):
+        self.page = (self.page + 1) % len(self.pages)
+        await interaction.response.edit_message(embed=self.pages[self.page], view=self)
+
 class MovieEntryView(discord.ui.View):
     def __init__(self):
         super().__init__(timeout=None)
@@ -1069,8 +3213,7 @@ class MovieEntryView(discord.ui.View):
                 f"You already have `{MAX_POOL_ENTRIES_PER_USER}` pick(s) in the pool. Use </replace:1444418642103107676> to swap one.",
                 ephemeral=True,
             )
-        pool.append((user.id, movie_title))
-        await save_request_pool()
+        await add_pool_entry(guild.id, user.id, movie_title)
         await update_pool_public_message(guild)
         await interaction.response.send_message(
             f"Added **{movie_title}** • You now have `{user_count + 1}` pick(s) in the pool.",
@@ -1086,13 +3229,16 @@ async def movie_autocomplete(ctx: discord.AutocompleteContext):
         titles = [t for t in titles if query in t.lower()]
     return titles[:25]
 
+async def timezone_autocomplete(ctx: discord.AutocompleteContext):
+    query = (ctx.value or "").lower().replace(" ", "_")
+    return [name for name in BIRTHDAY_TIMEZONES if query in name.lower()][:25]
+
 async def my_pool_movie_autocomplete(ctx: discord.AutocompleteContext):
     guild = ctx.interaction.guild
     if guild is None:
         return []
-    pool = request_pool.get(guild.id, [])
     user_id = ctx.interaction.user.id
-    titles = [title for uid, title in pool if uid == user_id]
+    titles = await storage_backend.picks_by_user(guild.id, user_id)
     query = (ctx.value or "").lower()
     if query:
         titles = [t for t in titles if query in t.lower()]
@@ -1100,86 +3246,92 @@ async def my_pool_movie_autocomplete(ctx: discord.AutocompleteContext):
 
 
 ############### BACKGROUND TASKS & SCHEDULERS ###############
-async def qotd_scheduler():
-    await bot.wait_until_ready()
-    TARGET_HOUR_UTC = 17
-    TARGET_MINUTE = 0
-    while not bot.is_closed():
-        now = datetime.utcnow()
-        if now.hour == TARGET_HOUR_UTC and now.minute == TARGET_MINUTE:
-            try:
-                await post_daily_qotd()
-            except Exception as e:
-                await log_exception("qotd_scheduler", e)
-            await asyncio.sleep(61)
-        await asyncio.sleep(30)
-
-async def theme_scheduler():
-    await bot.wait_until_ready()
-    TARGET_HOUR_UTC = 9
-    TARGET_MINUTE = 0
-    while not bot.is_closed():
-        now = datetime.utcnow()
-        if now.hour == TARGET_HOUR_UTC and now.minute == TARGET_MINUTE:
-            today = now.strftime("%m-%d")
-            for guild in bot.guilds:
-                try:
-                    await apply_theme_for_today(guild, today)
-                except Exception as e:
-                    await log_exception(f"theme_scheduler_guild_{guild.id}", e)
-            await asyncio.sleep(61)
-        await asyncio.sleep(30)
-
-async def birthday_checker():
-    await bot.wait_until_ready()
-    TARGET_HOUR_UTC = 15
-    TARGET_MINUTE = 0
-    while not bot.is_closed():
-        now = datetime.utcnow()
-        if now.hour == TARGET_HOUR_UTC and now.minute == TARGET_MINUTE:
-            today = now.strftime("%m-%d")
-            for guild in bot.guilds:
-                try:
-                    role = guild.get_role(BIRTHDAY_ROLE_ID)
-                    if not role:
-                        await log_to_thread(f"birthday_checker guild={guild.id} today={today} skipped; birthday role not found.")
-                        continue
-                    bdays = await get_guild_birthdays(guild.id)
-                    for member in guild.members:
-                        if bdays.get(str(member.id)) == today:
-                            if role not in member.roles:
-                                await member.add_roles(role, reason="Birthday!")
-                        else:
-                            if role in member.roles:
-                                await member.remove_roles(role, reason="Birthday over")
-                    await log_to_thread(f"birthday_checker guild={guild.id} today={today} birthdays_tracked={len(bdays)}")
-                except Exception as e:
-                    await log_exception(f"birthday_checker_guild_{guild.id}", e)
-            await asyncio.sleep(61)
-        await asyncio.sleep(30)
+async def qotd_scheduler(slot: datetime) -> JobOutcome:
+    now = datetime.now(timezone.utc)
+    if not job_ledger.is_due("qotd_scheduler", str(QOTD_CHANNEL_ID), slot, now):
+        return JobOutcome()
+    return await run_daily_job("qotd_scheduler", str(QOTD_CHANNEL_ID), slot, now, post_daily_qotd)
+
+async def qotd_stager(slot: datetime) -> JobOutcome:
+    now = datetime.now(timezone.utc)
+    if not sheets.enabled or not job_ledger.is_due("qotd_stager", str(QOTD_CHANNEL_ID), slot, now):
+        return JobOutcome()
+
+    async def run() -> JobOutcome:
+        return JobOutcome(items=await stage_qotd())
+
+    return await run_daily_job("qotd_stager", str(QOTD_CHANNEL_ID), slot, now, run)
+
+async def theme_scheduler(slot: datetime) -> JobOutcome:
+    now = datetime.now(timezone.utc)
+    today = now.strftime("%m-%d")
+    due = [guild.id for guild in bot.guilds if job_ledger.is_due("theme_scheduler", str(guild.id), slot, now)]
+
+    async def apply(guild_id: int) -> JobOutcome:
+        guild = bot.get_guild(guild_id)
+        if not guild:
+            return JobOutcome()
+
+        async def run() -> JobOutcome:
+            _, *counts, failed = await apply_theme_for_today(guild, today)
+            return JobOutcome(items=sum(counts), errors=failed)
+
+        return await run_daily_job("theme_scheduler", str(guild_id), slot, now, run)
+
+    return await fan_out_guilds("theme_scheduler", due, apply)
+
+async def birthday_checker(scheduled: datetime) -> JobOutcome:
+    now = datetime.now(timezone.utc)
+    due: dict[int, list[int]] = {}
+    while (entry := birthday_roles.pop_due(now.timestamp())) is not None:
+        due.setdefault(entry[0], []).append(entry[1])
+    retry_at = now + timedelta(seconds=BIRTHDAY_ROLE_RETRY_SECONDS)
+    for guild_id, user_ids in due.items():
+        for user_id in user_ids:
+            birthday_roles.schedule(guild_id, user_id, retry_at)
+
+    async def apply_guild(guild_id: int) -> JobOutcome:
+        ops = [(f"user {user_id}", lambda user_id=user_id: apply_birthday_role(guild_id, user_id, now)) for user_id in due[guild_id]]
+        applied, failed = await run_member_ops(f"birthday_checker guild={guild_id}", ops)
+        return JobOutcome(items=applied, errors=failed)
+
+    return await fan_out_guilds("birthday_checker", list(due), apply_guild)
+
+def _next_birthday_transition(now: datetime) -> datetime | None:
+    deadline = birthday_roles.next_deadline()
+    return datetime.fromtimestamp(deadline, timezone.utc) if deadline is not None else None
+
+job_scheduler.register_daily("qotd_scheduler", DailySchedule(QOTD_POST_HOUR, 0), qotd_scheduler, timeout=300)
+job_scheduler.register_daily("qotd_stager", DailySchedule((QOTD_POST_HOUR - QOTD_STAGE_LEAD_HOURS) % 24, 0), qotd_stager, timeout=600)
+job_scheduler.register_daily("theme_scheduler", DailySchedule(9, 0), theme_scheduler, timeout=900)
+job_scheduler.register("birthday_checker", _next_birthday_transition, birthday_checker, timeout=300, spec="per-member local midnight")
 
 
 ############### EVENT HANDLERS ###############
 @bot.event
 async def on_ready():
-    global startup_logging_done, startup_log_buffer
+    global startup_logging_done, startup_log_buffer, startup_complete
+
+    if startup_complete and birthday_storage_loaded and pool_storage_loaded:
+        task_registry.ensure("job_scheduler", job_scheduler.run)
+        await log_to_thread(f"on_ready: reconnected as {bot.user}; storage already loaded, skipped startup work.")
+        return
 
     startup_logging_done = False
     startup_log_buffer = []
     startup_log_buffer.append(f"{bot.user} is online!")
 
+    await storage_backend.open()
     await initialize_storage_message()
-    await initialize_media_lists()
+    await load_birthday_storage()
+    await initialize_sheet_snapshot()
     await load_request_pool()
-    bot.loop.create_task(qotd_scheduler())
-    bot.loop.create_task(theme_scheduler())
-    bot.loop.create_task(birthday_checker())
+    await persist_storage_migrations()
+    task_registry.ensure("job_scheduler", job_scheduler.run)
     await run_startup_checks()
+    startup_complete = True
 
-    startup_log_buffer.append("birthday_checker started.")
-    startup_log_buffer.append("qotd_scheduler started.")
-    startup_log_buffer.append("theme_scheduler started.")
-    startup_log_buffer.append("Schedulers started: birthday_checker, qotd_scheduler, theme_scheduler.")
+    startup_log_buffer.append(f"Scheduler started with jobs: {', '.join(job_scheduler.jobs)}.")
     startup_log_buffer.append("")
     startup_log_buffer.append("All systems passed basic storage + runtime checks.")
     startup_log_buffer.append(f"Bot ready as {bot.user} in {len(bot.guilds)} guild(s).")
@@ -1199,11 +3351,21 @@ async def on_ready():
 
 @bot.event
 async def on_member_join(member):
+    birthday_embeds.invalidate(member.guild.id)
     try:
         await member.send("Welcome! Add your birthday here → https://discord.com/channels/1205041211610501120/1440989357535395911/1440989655515271248")
     except:
         pass
 
+@bot.event
+async def on_member_remove(member):
+    birthday_embeds.invalidate(member.guild.id)
+
+@bot.event
+async def on_member_update(before, after):
+    if before.display_name != after.display_name:
+        birthday_embeds.invalidate(after.guild.id)
+
 @bot.event
 async def on_voice_state_update(member, before, after):
     vc_id = 1331501272804884490
@@ -1266,44 +3428,39 @@ async def editbotmsg(
     await ctx.respond("Message updated.", ephemeral=True)
 
 @bot.slash_command(name="set", description="Share your birthday with the server")
-async def set_birthday_self(ctx, month: discord.Option(str, choices=MONTH_CHOICES), day: int):
+async def set_birthday_self(ctx, month: discord.Option(str, choices=MONTH_CHOICES), day: int, tz: discord.Option(str, name="timezone", description="Your timezone, e.g. Asia/Tokyo", autocomplete=timezone_autocomplete, required=False) = None):
     mm_dd = build_mm_dd(month, day)
     if not mm_dd:
         return await ctx.respond("Invalid date.", ephemeral=True)
-    await set_birthday(ctx.guild.id, ctx.author.id, mm_dd)
+    if tz and not is_valid_timezone(tz):
+        return await ctx.respond("Unknown timezone. Pick one from the list, e.g. `Europe/London`.", ephemeral=True)
+    tz = tz or get_birthday_timezone(ctx.guild.id, ctx.author.id)
+    if not await set_birthday(ctx.guild.id, ctx.author.id, mm_dd, tz):
+        return await ctx.respond("Birthday storage is unavailable right now. Try again later.", ephemeral=True)
     await update_birthday_list_message(ctx.guild)
-    await ctx.respond(f"Birthday set to `{mm_dd}`!", ephemeral=True)
+    await ctx.respond(f"Birthday set to `{mm_dd}` ({tz or BIRTHDAY_DEFAULT_TIMEZONE})!", ephemeral=True)
 
 @bot.slash_command(name="set_for", description="Add a birthday for a member")
-async def set_for(ctx, member: discord.Member, month: discord.Option(str, choices=MONTH_CHOICES), day: int):
+async def set_for(ctx, member: discord.Member, month: discord.Option(str, choices=MONTH_CHOICES), day: int, tz: discord.Option(str, name="timezone", description="Member's timezone, e.g. Asia/Tokyo", autocomplete=timezone_autocomplete, required=False) = None):
     if not (ctx.author.guild_permissions.administrator or ctx.guild.owner_id == ctx.author.id):
         return await ctx.respond("Admin only.", ephemeral=True)
     mm_dd = build_mm_dd(month, day)
     if not mm_dd:
         return await ctx.respond("Invalid date.", ephemeral=True)
-    await set_birthday(ctx.guild.id, member.id, mm_dd)
+    if tz and not is_valid_timezone(tz):
+        return await ctx.respond("Unknown timezone. Pick one from the list, e.g. `Europe/London`.", ephemeral=True)
+    tz = tz or get_birthday_timezone(ctx.guild.id, member.id)
+    if not await set_birthday(ctx.guild.id, member.id, mm_dd, tz):
+        return await ctx.respond("Birthday storage is unavailable right now. Try again later.", ephemeral=True)
     await update_birthday_list_message(ctx.guild)
-    await ctx.respond(f"Set {member.mention}'s birthday to `{mm_dd}`", ephemeral=True)
+    await ctx.respond(f"Set {member.mention}'s birthday to `{mm_dd}` ({tz or BIRTHDAY_DEFAULT_TIMEZONE})", ephemeral=True)
 
 @bot.slash_command(name="remove_for", description="Remove a members birthday")
 async def remove_for(ctx, member: discord.Member):
     if not (ctx.author.guild_permissions.administrator or ctx.guild.owner_id == ctx.author.id):
         return await ctx.respond("Admin only.", ephemeral=True)
-    data = await _load_storage_message()
-    gid = str(ctx.guild.id)
-    entry = data.get(gid)
-    removed = False
-    if isinstance(entry, dict):
-        if isinstance(entry.get("birthdays"), dict):
-            if entry["birthdays"].pop(str(member.id), None):
-                removed = True
-        else:
-            if entry.pop(str(member.id), None):
-                removed = True
-            entry = {"birthdays": entry}
-            data[gid] = entry
+    removed = await remove_birthday(ctx.guild.id, member.id)
     if removed:
-        await _save_storage_message(data)
         await update_birthday_list_message(ctx.guild)
         await ctx.respond(f"Removed birthday for {member.mention}", ephemeral=True)
     else:
@@ -1311,37 +3468,109 @@ async def remove_for(ctx, member: discord.Member):
 
 @bot.slash_command(name="birthdays", description="View everyones birthdays")
 async def birthdays_cmd(ctx):
-    await ctx.respond(embed=await build_birthday_embed(ctx.guild), ephemeral=True)
+    pages = await build_birthday_embeds(ctx.guild)
+    if len(pages) == 1:
+        await ctx.respond(embed=pages[0], ephemeral=True)
+    else:
+        await ctx.respond(embed=pages[0], view=BirthdayPagerView(pages), ephemeral=True)
     await log_to_thread(f"/birthdays used by {ctx.author} ({ctx.author.id}) in guild {ctx.guild.id}.")
 
+@bot.slash_command(name="birthdays_upcoming", description="See whose birthday is coming up")
+async def birthdays_upcoming(ctx, days: discord.Option(int, description="How many days ahead to look", min_value=1, max_value=366, required=False) = 30):
+    today = datetime.now(birthday_zone(None)).date()
+    upcoming = upcoming_birthdays(ctx.guild.id, today, days)
+    lines = []
+    size = 0
+    for mm_dd, user_id in upcoming:
+        offset = days_until_birthday(mm_dd, today)
+        when = "today" if offset == 0 else "tomorrow" if offset == 1 else f"in {offset} days"
+        line = f"<@{user_id}> — `{mm_dd}` ({when})"
+        if size + len(line) + 1 > EMBED_DESCRIPTION_LIMIT - 40:
+            lines.append(f"…and {len(upcoming) - len(lines)} more.")
+            break
+        lines.append(line)
+        size += len(line) + 1
+    embed = discord.Embed(
+        title=f"UPCOMING BIRTHDAYS (next {days} days)",
+        description="\n".join(lines) if lines else "No birthdays coming up.",
+        color=0x2e2f33
+    )
+    await ctx.respond(embed=embed, ephemeral=True)
+    await log_to_thread(f"/birthdays_upcoming used by {ctx.author} ({ctx.author.id}) in guild {ctx.guild.id}: days={days} results={len(upcoming)}.")
+
 @bot.slash_command(name="birthdays_public", description="Create or update the public birthday list message")
 async def birthdays_public(ctx):
     if not (ctx.author.guild_permissions.administrator or ctx.guild.owner_id == ctx.author.id):
         return await ctx.respond("Admin only.", ephemeral=True)
-    embed = await build_birthday_embed(ctx.guild)
-    loc = await get_birthday_public_location(ctx.guild.id)
+    embeds = public_birthday_embeds(ctx.guild)
+    version = birthday_transactions.version(ctx.guild.id)
+    loc = get_birthday_public_location(ctx.guild.id)
     if loc:
         ch_id, msg_id = loc
         channel = ctx.guild.get_channel(ch_id)
         if channel:
             try:
-                msg = await channel.fetch_message(msg_id)
-                await msg.edit(embed=embed, allowed_mentions=discord.AllowedMentions(users=True))
-                await ctx.respond("Updated the existing public birthday list message.", ephemeral=True)
-                return
-            except:
+                if await edit_message_by_id(channel, msg_id, embeds=embeds, allowed_mentions=discord.AllowedMentions(users=True)):
+                    await ctx.respond("Updated the existing public birthday list message.", ephemeral=True)
+                    return
+            except discord.HTTPException:
                 pass
-    msg = await ctx.channel.send(embed=embed)
-    await set_birthday_public_location(ctx.guild.id, ctx.channel.id, msg.id)
+    msg = await ctx.channel.send(embeds=embeds)
+    while True:
+        try:
+            await set_birthday_public_location(ctx.guild.id, ctx.channel.id, msg.id, expected_version=version)
+            break
+        except BirthdayConflict:
+            if get_birthday_public_location(ctx.guild.id) != loc:
+                await msg.delete()
+                return await ctx.respond("Another public birthday list message was created at the same time; kept that one.", ephemeral=True)
+            version = birthday_transactions.version(ctx.guild.id)
     await ctx.respond("Created a new public birthday list message in this channel.", ephemeral=True)
 
+@bot.slash_command(name="birthdays_import", description="Import birthdays from a CSV or JSON file")
+async def birthdays_import(ctx, file: discord.Option(discord.Attachment, description="CSV (user_id,date,timezone) or JSON list")):
+    if not (ctx.author.guild_permissions.administrator or ctx.guild.owner_id == ctx.author.id):
+        return await ctx.respond("Admin only.", ephemeral=True)
+    await ctx.defer(ephemeral=True)
+    if file.size > BIRTHDAY_IMPORT_MAX_BYTES:
+        return await ctx.followup.send(f"File is too large (limit {BIRTHDAY_IMPORT_MAX_BYTES} bytes).", ephemeral=True)
+    try:
+        birthdays, errors = parse_birthday_import(file.filename, await file.read())
+    except (UnicodeDecodeError, ValueError, csv.Error) as e:
+        return await ctx.followup.send(f"Could not read that file: {e}", ephemeral=True)
+    if errors:
+        shown = "\n".join(errors[:10])
+        more = f"\n…and {len(errors) - 10} more." if len(errors) > 10 else ""
+        return await ctx.followup.send(f"Nothing imported; fix these rows first:\n```text\n{shown}\n```{more}", ephemeral=True)
+    if not birthdays:
+        return await ctx.followup.send("No birthdays found in that file.", ephemeral=True)
+    if not await import_birthdays(ctx.guild.id, birthdays):
+        return await ctx.followup.send("Birthday storage is unavailable right now. Try again later.", ephemeral=True)
+    await update_birthday_list_message(ctx.guild)
+    await ctx.followup.send(f"Imported `{len(birthdays)}` birthday(s).", ephemeral=True)
+    await log_to_thread(f"/birthdays_import used by {ctx.author} ({ctx.author.id}) in guild {ctx.guild.id}: {len(birthdays)} row(s).")
+
+@bot.slash_command(name="birthdays_export", description="Download every birthday as a CSV or JSON file")
+async def birthdays_export(ctx, fmt: discord.Option(str, name="format", choices=["csv", "json"], required=False) = "csv"):
+    if not (ctx.author.guild_permissions.administrator or ctx.guild.owner_id == ctx.author.id):
+        return await ctx.respond("Admin only.", ephemeral=True)
+    if not await ensure_birthday_storage():
+        return await ctx.respond("Birthday storage is unavailable right now. Try again later.", ephemeral=True)
+    data = export_birthdays(ctx.guild.id, fmt).encode("utf-8")
+    await ctx.respond(f"`{len(get_guild_birthdays(ctx.guild.id))}` birthday(s).", file=discord.File(io.BytesIO(data), filename=f"birthdays-{ctx.guild.id}.{fmt}"), ephemeral=True)
+
 @bot.slash_command(name="media_reload", description="Reload movie list from Google Sheets")
 async def media_reload(ctx):
     if not (ctx.author.guild_permissions.administrator or ctx.guild.owner_id == ctx.author.id):
         return await ctx.respond("Admin only.", ephemeral=True)
     await ctx.defer(ephemeral=True)
-    await initialize_media_lists()
-    await ctx.followup.send("Reloaded movie list from Google Sheets.", ephemeral=True)
+    changed = await initialize_media_lists()
+    if changed is None:
+        await ctx.followup.send("Could not load the movie list from Google Sheets; see the log thread.", ephemeral=True)
+    elif changed:
+        await ctx.followup.send(f"Reloaded movie list from Google Sheets ({len(movie_titles)} movies).", ephemeral=True)
+    else:
+        await ctx.followup.send(f"Movie list unchanged ({len(movie_titles)} movies).", ephemeral=True)
 
 @bot.slash_command(name="library_sync", description="Sync movie library messages with the Movies sheet")
 async def library_sync(ctx):
@@ -1350,9 +3579,11 @@ async def library_sync(ctx):
     if MOVIE_STORAGE_CHANNEL_ID == 0:
         return await ctx.respond("MOVIE_STORAGE_CHANNEL_ID is not configured.", ephemeral=True)
     await ctx.defer(ephemeral=True)
-    await initialize_media_lists()
+    changed = await initialize_media_lists()
+    if changed is None:
+        return await ctx.followup.send("Could not load the movie list from Google Sheets; library messages were not synced.", ephemeral=True)
     await sync_movie_library_messages()
-    await ctx.followup.send("Library messages synced with Google Sheets.", ephemeral=True)
+    await ctx.followup.send(f"Library messages synced with Google Sheets ({len(movie_titles)} movies{'' if changed else ', sheet unchanged'}).", ephemeral=True)
 
 @bot.slash_command(name="pool_remove", description="Admin: Remove a pick from today's movie pool")
 async def pool_remove(
@@ -1368,10 +3599,10 @@ async def pool_remove(
     if not user and not title:
         return await ctx.respond("Specify either a user or a title.", ephemeral=True)
     removed = []
-    new_pool = []
+    removed_indices = []
     target_title = title.lower().strip() if title else None
     target_uid = user.id if user else None
-    for uid, movie_title in pool:
+    for index, (uid, movie_title) in enumerate(pool):
         match = False
         if target_uid and uid == target_uid:
             if not target_title or movie_title.lower() == target_title:
@@ -1382,12 +3613,10 @@ async def pool_remove(
             member = ctx.guild.get_member(uid)
             mention = member.mention if member else f"<@{uid}>"
             removed.append(f"{mention} — **{movie_title}**")
-        else:
-            new_pool.append((uid, movie_title))
+            removed_indices.append(index)
     if not removed:
         return await ctx.respond("No matching pick found.", ephemeral=True)
-    request_pool[ctx.guild.id] = new_pool
-    await save_request_pool()
+    await remove_pool_entries(ctx.guild.id, removed_indices)
     await update_pool_public_message(ctx.guild)
     await ctx.respond("Removed:\n" + "\n".join(removed), ephemeral=True)
 
@@ -1419,8 +3648,7 @@ async def pick(ctx, title: discord.Option(str, autocomplete=movie_autocomplete))
             f"You already have `{MAX_POOL_ENTRIES_PER_USER}` pick(s) in the pool. Use `/replace` to swap one.",
             ephemeral=True,
         )
-    pool.append((ctx.author.id, movie_title))
-    await save_request_pool()
+    await add_pool_entry(ctx.guild.id, ctx.author.id, movie_title)
     await update_pool_public_message(ctx.guild)
     await ctx.respond(f"Added **{movie_title}** • You now have `{user_count + 1}` pick(s) in the pool.", ephemeral=True)
 
@@ -1445,10 +3673,7 @@ async def pick_replace(
     ]
     if not indices:
         return await ctx.respond("That pick is not in the pool as yours.", ephemeral=True)
-    idx = indices[0]
-    pool[idx] = (ctx.author.id, new_movie_title)
-    request_pool[ctx.guild.id] = pool
-    await save_request_pool()
+    await replace_pool_entry(ctx.guild.id, indices[0], ctx.author.id, new_movie_title)
     await update_pool_public_message(ctx.guild)
     await ctx.respond(
         f"Replaced **{old_title}** with **{new_movie_title}** in the pool.",
@@ -1471,8 +3696,7 @@ async def random_pick(ctx):
     winner_idx = pyrandom.randrange(len(pool))
     winner_id, winner_title = pool[winner_idx]
 
-    request_pool[ctx.guild.id] = [e for i, e in enumerate(pool) if i != winner_idx]
-    await save_request_pool()
+    await remove_pool_entries(ctx.guild.id, [winner_idx])
     await update_pool_public_message(ctx.guild)
 
     member = ctx.guild.get_member(winner_id)
@@ -1533,14 +3757,12 @@ async def pool_public(ctx):
         channel = ctx.guild.get_channel(ch_id)
         if channel:
             try:
-                msg = await channel.fetch_message(msg_id)
-                await msg.edit(embed=embed)
-                return await ctx.respond("Updated the public pool message.", ephemeral=True)
-            except:
+                if await edit_message_by_id(channel, msg_id, embed=embed):
+                    return await ctx.respond("Updated the public pool message.", ephemeral=True)
+            except discord.HTTPException:
                 pass
     msg = await ctx.channel.send(embed=embed)
-    pool_message_locations[ctx.guild.id] = (ctx.channel.id, msg.id)
-    await save_request_pool()
+    await set_pool_public_location(ctx.guild.id, ctx.channel.id, msg.id)
     await ctx.respond("Created a new public pool message in this channel.", ephemeral=True)
 
 @bot.slash_command(name="theme_update", description="Recheck the date and apply the current seasonal theme for this server")
@@ -1551,7 +3773,7 @@ async def theme_update(ctx):
         return await ctx.respond("Admin only.", ephemeral=True)
     await ctx.defer(ephemeral=True)
     today = datetime.utcnow().strftime("%m-%d")
-    mode, removed_roles, removed_emojis, added_roles, added_emojis = await apply_theme_for_today(ctx.guild, today)
+    mode, removed_roles, removed_emojis, added_roles, added_emojis, failed_roles = await apply_theme_for_today(ctx.guild, today)
     if mode == "halloween":
         label = "Halloween theme applied."
     elif mode == "christmas":
@@ -1559,8 +3781,39 @@ async def theme_update(ctx):
     else:
         label = "Cleared theme and reverted to default."
     summary = f"{label}\nRoles cleared: {removed_roles}\nEmojis cleared: {removed_emojis}\nRoles added: {added_roles}\nEmojis added: {added_emojis}"
+    if failed_roles:
+        summary += f"\nRole edits failed: {failed_roles} (see the log thread)"
     await ctx.followup.send(summary, ephemeral=True)
 
+@bot.slash_command(name="tasks", description="Show the state of the bot's background tasks (admin only)")
+async def tasks_cmd(ctx):
+    if not (ctx.author.guild_permissions.administrator or ctx.guild.owner_id == ctx.author.id):
+        return await ctx.respond("Admin only.", ephemeral=True)
+    lines = task_registry.describe() or ["No background tasks registered."]
+    lines.append(job_scheduler.summary())
+    lines.append(journal_writer.summary())
+    lines.append(birthday_embeds.summary())
+    lines.append(birthday_transactions.summary())
+    await ctx.respond("```text\n" + "\n".join(lines)[:1900] + "\n```", ephemeral=True)
+
+@bot.slash_command(name="jobs", description="Show recent background job runs and durations (admin only)")
+async def jobs_cmd(ctx, job: discord.Option(str, choices=list(job_scheduler.jobs), required=False) = None):
+    if not (ctx.author.guild_permissions.administrator or ctx.guild.owner_id == ctx.author.id):
+        return await ctx.respond("Admin only.", ephemeral=True)
+    names = [job] if job else list(job_scheduler.jobs)
+    lines = [job_metrics.describe(name) for name in names]
+    runs = job_metrics.recent(job, limit=15)
+    if runs:
+        lines.append("")
+        lines.append("Recent runs (UTC):")
+    for run in runs:
+        lines.append(f"{run.started:%m-%d %H:%M:%S} {run.job} {run.status} • lag {run.lag:.1f}s • {run.duration:.2f}s • items {run.items} • errors {run.errors}")
+    if sheets.enabled:
+        lines.append("")
+        lines.extend(sheets.describe())
+    await ctx.respond("```text\n" + "\n".join(lines)[:1900] + "\n```", ephemeral=True)
+
 
 ############### ON_READY & BOT START ###############
-bot.run(os.getenv("TOKEN"))
+if __name__ == "__main__":
+    bot.run(os.getenv("TOKEN"))
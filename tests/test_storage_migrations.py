@@ -0,0 +1,100 @@
+import copy
+
+import pytest
+
+from main import (
+    BIRTHDAY_MIGRATIONS,
+    POOL_MIGRATIONS,
+    STORAGE_SCHEMA_VERSION,
+    birthday_models_from_document,
+    build_birthday_document,
+    migrate_storage_document,
+    pool_models_from_document,
+    storage_migrations,
+)
+
+LOCATION = {"channel_id": 111, "message_id": 222}
+
+
+@pytest.fixture(autouse=True)
+def clear_migration_log():
+    storage_migrations.clear()
+    yield
+    storage_migrations.clear()
+
+
+def migrate_birthdays(raw: dict) -> dict:
+    return migrate_storage_document("birthday", copy.deepcopy(raw), BIRTHDAY_MIGRATIONS)
+
+
+def migrate_pool(raw: dict) -> dict:
+    return migrate_storage_document("pool", copy.deepcopy(raw), POOL_MIGRATIONS)
+
+
+def test_flat_birthday_map_is_migrated():
+    doc = migrate_birthdays({"100": {"1": "01-02", "2": "12-31"}})
+    assert doc == {"schema": STORAGE_SCHEMA_VERSION, "guilds": {"100": {"birthdays": {"1": "01-02", "2": "12-31"}, "timezones": {}}}}
+    assert storage_migrations == [f"birthday v0->v{STORAGE_SCHEMA_VERSION}"]
+
+
+def test_mixed_birthday_map_keeps_public_message_and_drops_junk():
+    raw = {
+        "100": {"1": "01-02"},
+        "200": {"birthdays": {"3": "03-04", "bad": "05-06", "4": 7}, "public_message": {"channel_id": "111", "message_id": "222"}},
+        "300": {"birthdays": {}, "public_message": {"channel_id": "x"}},
+        "not-a-guild": {"5": "05-05"},
+    }
+    doc = migrate_birthdays(raw)
+    assert doc["guilds"] == {
+        "100": {"birthdays": {"1": "01-02"}, "timezones": {}},
+        "200": {"birthdays": {"3": "03-04"}, "public_message": LOCATION, "timezones": {}},
+        "300": {"birthdays": {}, "timezones": {}},
+    }
+    models = birthday_models_from_document(doc)
+    assert models[200].birthdays == {3: "03-04"}
+    assert models[200].public_message == (111, 222)
+    assert models[300].public_message is None
+
+
+def test_bare_list_pool_is_migrated():
+    doc = migrate_pool({"100": [[1, "Alien"], ["2", "Heat"], ["x", "Bad"], [3]]})
+    assert doc == {"schema": STORAGE_SCHEMA_VERSION, "guilds": {"100": {"entries": [[1, "Alien"], [2, "Heat"]]}}}
+    assert pool_models_from_document(doc)[100].entries == [(1, "Alien"), (2, "Heat")]
+
+
+def test_dict_pool_keeps_message_location():
+    doc = migrate_pool({"100": {"entries": [[1, "Alien"]], "message": LOCATION}, "200": "garbage"})
+    assert doc["guilds"] == {"100": {"entries": [[1, "Alien"]], "message": LOCATION}}
+    assert pool_models_from_document(doc)[100].message == (111, 222)
+
+
+def test_v2_birthdays_gain_timezones():
+    raw = {"schema": 2, "guilds": {"100": {"birthdays": {"1": "01-02"}, "public_message": LOCATION}}}
+    doc = migrate_birthdays(raw)
+    assert doc == {"schema": 3, "guilds": {"100": {"birthdays": {"1": "01-02"}, "public_message": LOCATION, "timezones": {}}}}
+    assert storage_migrations == ["birthday v2->v3"]
+
+
+def test_v2_pool_is_relabelled():
+    raw = {"schema": 2, "guilds": {"100": {"entries": [[1, "Alien"]]}}}
+    assert migrate_pool(raw) == {"schema": 3, "guilds": {"100": {"entries": [[1, "Alien"]]}}}
+
+
+def test_current_schema_is_untouched():
+    raw = {"schema": STORAGE_SCHEMA_VERSION, "guilds": {"100": {"birthdays": {"1": "01-02"}, "timezones": {"1": "Asia/Tokyo"}}}}
+    assert migrate_birthdays(raw) == raw
+    assert storage_migrations == []
+
+
+def test_newer_schema_is_rejected():
+    with pytest.raises(ValueError):
+        migrate_birthdays({"schema": STORAGE_SCHEMA_VERSION + 1, "guilds": {}})
+    with pytest.raises(ValueError):
+        migrate_pool({"schema": STORAGE_SCHEMA_VERSION + 1, "guilds": {}})
+
+
+def test_migrated_birthdays_round_trip():
+    doc = migrate_birthdays({"100": {"birthdays": {"1": "01-02"}, "public_message": LOCATION}})
+    rebuilt = build_birthday_document(birthday_models_from_document(doc))
+    assert rebuilt == doc
+    assert migrate_birthdays(rebuilt) == doc
@@ -0,0 +1,56 @@
+from datetime import date
+
+import pytest
+
+from main import GuildBirthdays, birthday_data, days_until_birthday, upcoming_birthdays
+
+GUILD_ID = 100
+
+BIRTHDAYS = {
+    1: "12-28",
+    2: "12-29",
+    3: "12-31",
+    4: "01-01",
+    5: "01-03",
+    6: "01-04",
+    7: "06-15",
+}
+
+
+@pytest.fixture(autouse=True)
+def guild_birthdays():
+    birthday_data[GUILD_ID] = GuildBirthdays(dict(BIRTHDAYS))
+    yield
+    birthday_data.pop(GUILD_ID, None)
+
+
+def test_window_wraps_from_december_into_january():
+    assert upcoming_birthdays(GUILD_ID, date(2026, 12, 29), 5) == [("12-29", 2), ("12-31", 3), ("01-01", 4), ("01-03", 5)]
+
+
+def test_wrapped_offsets_count_into_next_year():
+    today = date(2026, 12, 29)
+    assert [days_until_birthday(mm_dd, today) for mm_dd, _ in upcoming_birthdays(GUILD_ID, today, 5)] == [0, 2, 3, 5]
+
+
+def test_zero_days_returns_only_today():
+    assert upcoming_birthdays(GUILD_ID, date(2026, 12, 29), 0) == [("12-29", 2)]
+    assert upcoming_birthdays(GUILD_ID, date(2026, 12, 30), 0) == []
+
+
+def test_full_year_returns_everyone_starting_today():
+    expected = [("12-29", 2), ("12-31", 3), ("01-01", 4), ("01-03", 5), ("01-04", 6), ("06-15", 7), ("12-28", 1)]
+    assert upcoming_birthdays(GUILD_ID, date(2026, 12, 29), 365) == expected
+    assert upcoming_birthdays(GUILD_ID, date(2026, 12, 29), 366) == expected
+
+
+def test_negative_days_and_unknown_guild_are_empty():
+    assert upcoming_birthdays(GUILD_ID, date(2026, 12, 29), -1) == []
+    assert upcoming_birthdays(GUILD_ID + 1, date(2026, 12, 29), 30) == []
+
+
+def test_index_follows_adds_and_removes():
+    entry = birthday_data[GUILD_ID]
+    entry.add(8, "12-30")
+    entry.remove(3)
+    assert upcoming_birthdays(GUILD_ID, date(2026, 12, 29), 2) == [("12-29", 2), ("12-30", 8)]